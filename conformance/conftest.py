@@ -6,12 +6,21 @@
 """Common conftest for tests under 'tofusoup/conformance'.
 Provides shared fixtures and test collection modifications."""
 
+from collections.abc import Iterator
+import contextlib
 import os
 from pathlib import Path
 import shutil
+import sys
+import time
 
 import pytest
 
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
 from tofusoup.common.config import load_tofusoup_config
 from tofusoup.harness.logic import GO_HARNESS_CONFIG, TofuSoupError, ensure_go_harness_build
 
@@ -36,9 +45,78 @@ def loaded_tofusoup_config(project_root: Path) -> dict:
     return load_tofusoup_config(project_root=project_root, explicit_config_file=None)
 
 
+_BUILD_LOCK_TIMEOUT = 600.0
+
+
+def _try_lock(fd: int) -> bool:
+    """Take a non-blocking exclusive OS lock on fd, returning False if another process holds it."""
+    try:
+        if sys.platform == "win32":
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        else:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        return False
+    return True
+
+
+def _unlock(fd: int) -> None:
+    if sys.platform == "win32":
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+    else:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+@contextlib.contextmanager
+def _exclusive(lock_path: Path, timeout: float = _BUILD_LOCK_TIMEOUT) -> Iterator[None]:
+    """Hold an OS lock on lock_path so only one pytest-xdist worker enters at a time.
+
+    The OS releases the lock when its holder exits, so a worker killed mid-build
+    never leaves the others waiting out the timeout."""
+    deadline = time.monotonic() + timeout
+    with lock_path.open("a+b") as lock_file:
+        fd = lock_file.fileno()
+        while not _try_lock(fd):
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Timed out waiting for {lock_path}")
+            time.sleep(0.1)
+        try:
+            yield
+        finally:
+            _unlock(fd)
+
+
+def _build_go_harness(
+    harness_key: str, project_root: Path, loaded_config: dict, shared_dir: Path | None
+) -> Path:
+    """Build a Go harness, rebuilding it once per run even when xdist workers race for it.
+
+    shared_dir is the run's temp directory shared by all workers, or None outside xdist."""
+    if shared_dir is None:
+        return ensure_go_harness_build(
+            harness_name=harness_key,
+            project_root=project_root,
+            loaded_config=loaded_config,
+            force_rebuild=True,
+        )
+    with _exclusive(shared_dir / f"{harness_key}.lock"):
+        built_marker = shared_dir / f"{harness_key}.built"
+        executable_path = ensure_go_harness_build(
+            harness_name=harness_key,
+            project_root=project_root,
+            loaded_config=loaded_config,
+            force_rebuild=not built_marker.exists(),
+        )
+        built_marker.touch()
+        return executable_path
+
+
 @pytest.fixture(scope="session")
 def go_harness_executable(
-    request: pytest.FixtureRequest, project_root: Path, loaded_tofusoup_config: dict
+    request: pytest.FixtureRequest,
+    project_root: Path,
+    loaded_tofusoup_config: dict,
+    tmp_path_factory: pytest.TempPathFactory,
 ) -> Path:
     """
     A generic, parameterized fixture to build and provide any Go harness.
@@ -47,14 +125,10 @@ def go_harness_executable(
     harness_key = request.param
     if harness_key not in GO_HARNESS_CONFIG:
         pytest.fail(f"Harness key '{harness_key}' not found in GO_HARNESS_CONFIG.")
+    # xdist workers' base temp dirs share a parent that is unique to this run
+    shared_dir = tmp_path_factory.getbasetemp().parent if os.environ.get("PYTEST_XDIST_WORKER") else None
     try:
-        # THE FIX: Removed the incorrect 'output_base_dir' keyword argument.
-        executable_path = ensure_go_harness_build(
-            harness_name=harness_key,
-            project_root=project_root,
-            loaded_config=loaded_tofusoup_config,
-            force_rebuild=True,
-        )
+        executable_path = _build_go_harness(harness_key, project_root, loaded_tofusoup_config, shared_dir)
         if not executable_path.exists() or not os.access(executable_path, os.X_OK):
             pytest.fail(
                 f"Go harness executable '{harness_key}' missing or not executable at: {executable_path}"
@@ -0,0 +1,99 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Long-lived `soup-go repl` process for running one-shot harness commands.
+
+Spawning soup-go (fork, exec, Go runtime start, cobra parsing) costs far more
+than the cty/hcl/wire work the conformance tests ask of it, so the tests send
+their commands to a single worker process instead."""
+
+import base64
+import json
+import os
+from pathlib import Path
+import selectors
+import subprocess
+import time
+
+# Per-command deadline; generous next to the milliseconds a cty/hcl/wire command takes
+_CALL_TIMEOUT = 30.0
+
+
+class GoHarnessWorker:
+    """Runs soup-go commands through one `soup-go repl` child process.
+
+    The repl rebuilds soup-go's logger for every request, so command logs land in
+    the captured stderr of the request that produced them."""
+
+    def __init__(self, executable: Path) -> None:
+        self.executable = executable
+        self._process = self._spawn()
+
+    def _spawn(self) -> subprocess.Popen[bytes]:
+        return subprocess.Popen(
+            [str(self.executable), "repl"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            bufsize=0,
+        )
+
+    def call(
+        self, args: list[str], stdin: bytes = b"", timeout: float = _CALL_TIMEOUT
+    ) -> subprocess.CompletedProcess[bytes]:
+        """Run `soup-go <args>` in the worker and return its captured result.
+
+        If no response arrives within timeout seconds the worker is killed and
+        replaced, and subprocess.TimeoutExpired is raised."""
+        assert self._process.stdin is not None
+        command = [str(self.executable), *args]
+        request = {"args": args, "stdin": base64.b64encode(stdin).decode("ascii")}
+        self._process.stdin.write(json.dumps(request).encode() + b"\n")
+
+        line = self._read_line(timeout)
+        if line is None:
+            self._process.kill()
+            self._process.wait()
+            self._process = self._spawn()
+            raise subprocess.TimeoutExpired(command, timeout)
+        if not line:
+            raise RuntimeError(f"soup-go repl exited with code {self._process.wait()}")
+        response = json.loads(line)
+        return subprocess.CompletedProcess(
+            command,
+            response["exit_code"],
+            base64.b64decode(response["stdout"] or ""),
+            base64.b64decode(response["stderr"] or ""),
+        )
+
+    def _read_line(self, timeout: float) -> bytes | None:
+        """Read one response line, returning b"" on EOF and None once timeout elapses."""
+        assert self._process.stdout is not None
+        deadline = time.monotonic() + timeout
+        line = b""
+        with selectors.DefaultSelector() as selector:
+            selector.register(self._process.stdout, selectors.EVENT_READ)
+            while not line.endswith(b"\n"):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not selector.select(timeout=remaining):
+                    return None
+                # The worker answers one request at a time, so nothing follows the newline
+                chunk = os.read(self._process.stdout.fileno(), 65536)
+                if not chunk:
+                    return b""
+                line += chunk
+        return line
+
+    def close(self) -> None:
+        """Close the worker's stdin and wait for it to exit."""
+        if self._process.stdin is not None:
+            self._process.stdin.close()
+        try:
+            self._process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self._process.kill()
+            self._process.wait()
+
+
+# 🥣🔬🔚
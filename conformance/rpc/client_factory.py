@@ -0,0 +1,38 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Factory for the EC auto-mTLS KVClient most RPC conformance tests construct."""
+
+from collections.abc import AsyncIterator
+import contextlib
+from pathlib import Path
+
+from tofusoup.rpc.client import KVClient
+
+
+def automtls_client(
+    server_path: str | Path, curve: str = "auto", connection_timeout: float | None = None
+) -> KVClient:
+    """Return an unstarted KVClient using auto-mTLS with an EC key on the given curve.
+
+    curve="auto" leaves the choice to the go-plugin AutoMTLS default."""
+    client = KVClient(server_path=str(server_path), tls_mode="auto", tls_key_type="ec", tls_curve=curve)
+    if connection_timeout is not None:
+        client.connection_timeout = connection_timeout
+    return client
+
+
+@contextlib.asynccontextmanager
+async def managed_client(client: KVClient) -> AsyncIterator[KVClient]:
+    """Start client, yield it, and close it on exit, ignoring close failures."""
+    try:
+        await client.start()
+        yield client
+    finally:
+        with contextlib.suppress(Exception):
+            await client.close()
+
+
+# 🥣🔬🔚
@@ -0,0 +1,52 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Pool of started KVClients shared across the examples of one test.
+
+Hypothesis runs every generated example of a test on the same event loop, so
+a client started for one example can serve the next instead of spawning a
+new plugin process and repeating the TLS handshake."""
+
+import asyncio
+from typing import Any
+
+from tofusoup.rpc.client import KVClient
+
+
+class KVClientPool:
+    """Started KVClients keyed by server path and client configuration."""
+
+    def __init__(self) -> None:
+        self._clients: dict[tuple[Any, ...], KVClient] = {}
+
+    async def get(self, server_path: str, connection_timeout: float | None = None, **config: Any) -> KVClient:
+        """Return a started client for this configuration, starting one on first use."""
+        key = (server_path, connection_timeout, *sorted(config.items()))
+        client = self._clients.pop(key, None)
+        if client is not None and client.is_started:
+            self._clients[key] = client
+            return client
+        if client is not None:
+            await client.close()
+
+        client = KVClient(server_path=server_path, **config)
+        if connection_timeout is not None:
+            client.connection_timeout = connection_timeout
+        try:
+            await client.start()
+        except BaseException:
+            await client.close()
+            raise
+        self._clients[key] = client
+        return client
+
+    async def close(self) -> None:
+        """Close every pooled client, ignoring individual close failures."""
+        clients = list(self._clients.values())
+        self._clients.clear()
+        await asyncio.gather(*(client.close() for client in clients), return_exceptions=True)
+
+
+# 🥣🔬🔚
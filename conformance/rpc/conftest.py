@@ -6,16 +6,44 @@
 """Pytest fixtures for RPC conformance tests.
 
 Provides session-scoped fixtures for:
-- Go harness building and path resolution
+- Go harness path resolution (building is shared via conformance/conftest.py)
 - Test artifact directory management
 - Project root and configuration loading
+- Event loop policy selection (uvloop on request)
+- Per-worker KV storage when running under pytest-xdist
+
+and a per-test pool of started KVClients for property tests.
 """
 
+import asyncio
+from collections.abc import AsyncIterator, Iterator
+import functools
+import os
 import pathlib
+import shutil
+import sys
+from typing import TYPE_CHECKING
 
 import pytest
 
-from tofusoup.harness.logic import ensure_go_harness_build
+from tofusoup.config.defaults import ENV_KV_STORAGE_DIR
+
+if TYPE_CHECKING:
+    from .client_pool import KVClientPool
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Run the RPC tests on the stdlib event loop, or on uvloop when explicitly requested.
+
+    uvloop is not a declared dependency, so it is only used with TOFUSOUP_TEST_UVLOOP=1
+    (see conformance/rpc/README.md); the loop under test never depends on what happens to be installed.
+    """
+    if os.environ.get("TOFUSOUP_TEST_UVLOOP") == "1":
+        import uvloop
+
+        return uvloop.EventLoopPolicy()
+    return asyncio.DefaultEventLoopPolicy()
 
 
 @pytest.fixture(scope="session")
@@ -31,21 +59,44 @@ def loaded_tofusoup_config() -> dict:
     return {}
 
 
+@functools.cache
+def _find_soup_executable() -> pathlib.Path | None:
+    """Locate the Python `soup` executable on PATH or next to the running interpreter (cached)."""
+    soup = shutil.which("soup")
+    if soup:
+        return pathlib.Path(soup)
+
+    # Un-activated virtualenvs keep console scripts beside the interpreter, not on PATH
+    venv_soup = pathlib.Path(sys.executable).parent / "soup"
+    return venv_soup if venv_soup.exists() else None
+
+
+@functools.cache
+def _find_soup_go_executable() -> pathlib.Path | None:
+    """Locate a prebuilt `soup-go` binary in the usual locations (cached for the process)."""
+    candidates = [
+        pathlib.Path("bin/soup-go"),
+        pathlib.Path("harnesses/bin/soup-go"),
+        pathlib.Path(__file__).parent.parent.parent / "bin" / "soup-go",
+    ]
+    for path in candidates:
+        if path.exists():
+            return path.resolve()
+
+    soup_go = shutil.which("soup-go")
+    return pathlib.Path(soup_go) if soup_go else None
+
+
 @pytest.fixture(scope="session")
-def go_harness_executable(project_root: pathlib.Path, loaded_tofusoup_config: dict) -> pathlib.Path:
-    """
-    Builds the unified 'soup-go' harness once per session and returns its path.
-    This is the single source of truth for the Go harness in all conformance tests.
-    """
-    try:
-        executable_path = ensure_go_harness_build(
-            "soup-go", project_root, loaded_tofusoup_config, force_rebuild=True
-        )
-        if not executable_path.exists():
-            pytest.fail(f"Go harness 'soup-go' failed to build at {executable_path}", pytrace=False)
-        return executable_path
-    except Exception as e:
-        pytest.fail(f"Failed to build 'soup-go' harness: {e}", pytrace=False)
+def soup_path() -> pathlib.Path | None:
+    """Find the soup executable (Python)."""
+    return _find_soup_executable()
+
+
+@pytest.fixture(scope="session")
+def soup_go_path() -> pathlib.Path | None:
+    """Find the soup-go executable."""
+    return _find_soup_go_executable()
 
 
 @pytest.fixture(scope="session")
@@ -63,6 +114,49 @@ def test_artifacts_dir(tmp_path_factory: pytest.TempPathFactory) -> pathlib.Path
     return artifacts_dir
 
 
+@pytest.fixture(scope="session", autouse=True)
+def _per_worker_kv_storage(tmp_path_factory: pytest.TempPathFactory) -> Iterator[None]:
+    """Give each pytest-xdist worker its own KV store for the servers KVClient spawns.
+
+    Plugin servers inherit this process's environment, so without a per-worker
+    KV_STORAGE_DIR every worker shares the cache-dir store and same-named keys from
+    tests running in parallel overwrite each other. An explicit KV_STORAGE_DIR wins.
+    """
+    if not os.environ.get("PYTEST_XDIST_WORKER") or ENV_KV_STORAGE_DIR in os.environ:
+        yield
+        return
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv(ENV_KV_STORAGE_DIR, str(tmp_path_factory.mktemp("kv-store")))
+        yield
+
+
+@pytest.fixture(scope="session")
+def plugin_env() -> dict[str, str]:
+    """Environment for soup / soup-go processes the tests start directly, built once per session.
+
+    Carries the go-plugin magic cookie and an INFO log level on top of the session's
+    environment. Tests add their own KV_STORAGE_DIR when copying it.
+    """
+    return {
+        **os.environ,
+        "LOG_LEVEL": "INFO",
+        "BASIC_PLUGIN": "hello",
+        "PLUGIN_MAGIC_COOKIE_KEY": "BASIC_PLUGIN",
+    }
+
+
+@pytest.fixture
+async def kv_client_pool() -> AsyncIterator["KVClientPool"]:
+    """Started KVClients shared by all examples of one test, closed when the test ends."""
+    from .client_pool import KVClientPool
+
+    pool = KVClientPool()
+    try:
+        yield pool
+    finally:
+        await pool.close()
+
+
 def _extract_lang_from_parametrize_markers(item: pytest.Item) -> tuple[str | None, str | None]:
     client_lang = None
     server_lang = None
@@ -25,6 +25,9 @@ from tofusoup.rpc.client import KVClient
 from .cert_manager import CertificateManager
 from .matrix_config import CryptoConfig
 
+# Poll interval while waiting for a terminated server to exit; servers usually exit within milliseconds
+_EXIT_POLL_INTERVAL = 0.01
+
 
 class ReferenceKVServer:
     """Base class for KV server implementations."""
@@ -83,13 +86,12 @@ class GoKVServer(ReferenceKVServer):
         args = [str(soup_go_path), "rpc", "kv", "server"]
         args.extend(self.crypto_config.to_go_cli_args())
 
-        print(f"DEBUG: soup-go args: {args}")
-
         # Set up environment with combo identification
         env = os.environ.copy()
         env.update(
             {
-                "LOG_LEVEL": "TRACE",
+                # TRACE logging slows every request; see conformance/rpc/README.md for TOFUSOUP_DEBUG_TEST
+                "LOG_LEVEL": "TRACE" if os.environ.get("TOFUSOUP_DEBUG_TEST") else "INFO",
                 "PYTHONUNBUFFERED": "1",
                 "KV_STORAGE_DIR": str(self.storage_dir),
                 "SERVER_LANGUAGE": self.server_language,
@@ -103,7 +105,6 @@ class GoKVServer(ReferenceKVServer):
 
         # Start Go server process
         logger.info(f"Starting Go KV server via soup-go: {' '.join(args)}")
-        print(f"DEBUG: Full command: {' '.join(args)}")
         self.process = subprocess.Popen(
             args, env=env, cwd=self.work_dir, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
         )
@@ -140,7 +141,7 @@ class GoKVServer(ReferenceKVServer):
     async def _wait_for_process(self) -> None:
         """Wait for process to terminate in async context."""
         while self.process and self.process.poll() is None:
-            await asyncio.sleep(0.1)
+            await asyncio.sleep(_EXIT_POLL_INTERVAL)
 
 
 class PythonKVServer(ReferenceKVServer):
@@ -223,7 +224,7 @@ class PythonKVServer(ReferenceKVServer):
     async def _wait_for_process(self) -> None:
         """Wait for process to terminate in async context."""
         while self.process and self.process.poll() is None:
-            await asyncio.sleep(0.1)
+            await asyncio.sleep(_EXIT_POLL_INTERVAL)
 
 
 class ReferenceKVClient:
@@ -0,0 +1,87 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Async helpers for driving soup / soup-go processes from cross-language tests."""
+
+import asyncio
+import re
+import subprocess
+
+from provide.foundation import logger
+
+# Network field of a go-plugin handshake line: core|proto|network|address|protocol|cert
+_HANDSHAKE_NETWORK = re.compile(rb"\|(?:tcp|unix)\|")
+
+
+async def run_go_client(
+    command: list[str], env: dict[str, str], timeout: float = 10
+) -> subprocess.CompletedProcess[bytes]:
+    """Run a soup-go client command without blocking the event loop.
+
+    Output is returned undecoded; callers match ASCII markers as bytes and only
+    decode when reporting a failure."""
+    process = await asyncio.create_subprocess_exec(
+        *command, env=env, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=timeout)
+    except TimeoutError:
+        process.kill()
+        await process.wait()
+        raise
+    return subprocess.CompletedProcess(command, process.returncode or 0, stdout, stderr)
+
+
+async def read_handshake(process: asyncio.subprocess.Process, timeout: float) -> str:
+    """Return the go-plugin handshake line a server writes to stdout, or "" on timeout.
+
+    Lines are matched as bytes; only the handshake line is decoded. Raises
+    AssertionError with the server's stderr if it exits before handshaking.
+    """
+
+    async def _read() -> str:
+        while line := await process.stdout.readline():
+            if _HANDSHAKE_NETWORK.search(line):
+                return line.strip().decode()
+        stderr_output = (await process.stderr.read()).decode(errors="replace")
+        logger.error(f"❌ Server terminated prematurely! Stderr: {stderr_output}")
+        raise AssertionError(f"Server process terminated prematurely. Stderr: {stderr_output}")
+
+    try:
+        return await asyncio.wait_for(_read(), timeout=timeout)
+    except TimeoutError:
+        return ""
+
+
+async def _discard(stream: asyncio.StreamReader) -> None:
+    while await stream.read(65536):
+        pass
+
+
+def drain_output(process: asyncio.subprocess.Process) -> asyncio.Future[list[None]]:
+    """Discard a server's remaining stdout and stderr in the background.
+
+    Nobody reads the pipes once the handshake is parsed; without draining, a chatty
+    server blocks on a full pipe buffer. The returned future finishes once the
+    process closes both streams.
+    """
+    return asyncio.gather(_discard(process.stdout), _discard(process.stderr))
+
+
+async def stop_server(
+    process: asyncio.subprocess.Process, drain: asyncio.Future[list[None]] | None = None, timeout: float = 5.0
+) -> None:
+    """Terminate a server started with create_subprocess_exec and wait for it to exit.
+
+    If drain_output() was started for the process, pass its future to wait for it too.
+    """
+    if process.returncode is None:
+        process.terminate()
+    await asyncio.wait_for(process.wait(), timeout=timeout)
+    if drain is not None:
+        await asyncio.wait_for(drain, timeout=timeout)
+
+
+# 🥣🔬🔚
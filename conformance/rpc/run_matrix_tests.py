@@ -14,11 +14,10 @@ import sys
 
 def run_command(cmd: list[str], description: str) -> bool:
     """Run a command and display results."""
-    print(f"\n{'=' * 60}")
-    print(f"🏃 {description}")
-    print(f"{'=' * 60}")
-    print(f"Command: {' '.join(cmd)}")
-    print()
+    rule = "=" * 60
+    # Emit the banner in one write and flush before the child inherits stdout
+    sys.stdout.write(f"\n{rule}\n🏃 {description}\n{rule}\nCommand: {' '.join(cmd)}\n\n")
+    sys.stdout.flush()
 
     result = subprocess.run(cmd, capture_output=False)
 
@@ -68,20 +67,20 @@ def main() -> None:
 
     # Parse command line arguments
     if len(sys.argv) < 2 or sys.argv[1] not in test_configs:
-        print("🍲 TofuSoup RPC K/V Matrix Test Runner")
-        print("\nAvailable test configurations:")
-        for config_name, config in test_configs.items():
-            print(f"  {config_name:15} - {config['description']}")
-        print(f"\nUsage: {sys.argv[0]} <config>")
-        print(f"Example: {sys.argv[0]} quick")
+        lines = ["🍲 TofuSoup RPC K/V Matrix Test Runner", "", "Available test configurations:"]
+        lines.extend(f"  {name:15} - {cfg['description']}" for name, cfg in test_configs.items())
+        lines.extend(["", f"Usage: {sys.argv[0]} <config>", f"Example: {sys.argv[0]} quick", ""])
+        sys.stdout.write("\n".join(lines))
         sys.exit(1)
 
     config_name = sys.argv[1]
     config = test_configs[config_name]
 
-    print("🍲 TofuSoup RPC K/V Matrix Test Runner")
-    print(f"Configuration: {config_name}")
-    print(f"Description: {config['description']}")
+    sys.stdout.write(
+        f"🍲 TofuSoup RPC K/V Matrix Test Runner\n"
+        f"Configuration: {config_name}\n"
+        f"Description: {config['description']}\n"
+    )
 
     # Build command
     base_cmd = ["python", "-m", "pytest"]
@@ -0,0 +1,32 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Shared server binary locations for the RPC property tests.
+
+Hypothesis re-runs each test body for every generated example, so the
+existence probe for the Go server is memoized instead of stat-ing the
+binary on every example."""
+
+from pathlib import Path
+
+GO_SERVER_PATH = Path("bin/soup-go")
+
+_existing_paths: set[str] = set()
+
+
+def path_exists(path: Path) -> bool:
+    """Return whether path exists, remembering positive results for the process.
+
+    Misses are not cached so a binary built later in the session is still found."""
+    key = str(path)
+    if key in _existing_paths:
+        return True
+    if path.exists():
+        _existing_paths.add(key)
+        return True
+    return False
+
+
+# 🥣🔬🔚
@@ -12,13 +12,14 @@ Tests multiple simultaneous clients to detect:
 - Resource leaks under load"""
 
 import asyncio
-from pathlib import Path
 
 from hypothesis import HealthCheck, given, settings, strategies as st
 import pytest
 
 from tofusoup.rpc.client import KVClient
 
+from .server_paths import GO_SERVER_PATH, path_exists
+
 # Safe key constraints (from property_test_rpc_stress.py)
 SAFE_KEY_ALPHABET = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-_.@"
 MAX_KEY_LENGTH = 200
@@ -46,8 +47,8 @@ async def test_concurrent_clients_same_key(num_clients: int, key: str, value: by
     - File locking issues
     - Server crashes under concurrent load
     """
-    go_server = Path("bin/soup-go")
-    if not go_server.exists():
+    go_server = GO_SERVER_PATH
+    if not path_exists(go_server):
         pytest.skip("soup-go not found")
 
     clients = []
@@ -103,8 +104,8 @@ async def test_concurrent_operations_different_keys(num_concurrent_ops: int) ->
     - No cross-contamination
     - Server stability under parallel load
     """
-    go_server = Path("bin/soup-go")
-    if not go_server.exists():
+    go_server = GO_SERVER_PATH
+    if not path_exists(go_server):
         pytest.skip("soup-go not found")
 
     client = KVClient(
@@ -145,8 +146,8 @@ async def test_connection_pool_exhaustion() -> None:
 
     Not property-based, but tests resource management.
     """
-    go_server = Path("bin/soup-go")
-    if not go_server.exists():
+    go_server = GO_SERVER_PATH
+    if not path_exists(go_server):
         pytest.skip("soup-go not found")
 
     # Create and close many clients sequentially
@@ -188,8 +189,8 @@ async def test_concurrent_readers(num_readers: int, key: str, value: bytes) -> N
     - No corruption during concurrent reads
     - Server stability under read load
     """
-    go_server = Path("bin/soup-go")
-    if not go_server.exists():
+    go_server = GO_SERVER_PATH
+    if not path_exists(go_server):
         pytest.skip("soup-go not found")
 
     writer = KVClient(
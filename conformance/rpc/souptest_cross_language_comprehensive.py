@@ -15,45 +15,26 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
-import os
 from pathlib import Path
-import shutil
-import subprocess
-import time
+from typing import TYPE_CHECKING
 
 from provide.foundation import logger
 import pytest
 
+from .plugin_process import drain_output, read_handshake, run_go_client, stop_server
+from .tls_defaults import FAST_CURVE
 
-@pytest.fixture
-def soup_go_path() -> Path | None:
-    """Find the soup-go executable."""
-    # Try multiple possible locations
-    candidates = [
-        Path("bin/soup-go"),
-        Path("harnesses/bin/soup-go"),
-        Path(__file__).parent.parent.parent / "bin" / "soup-go",
-    ]
-
-    for path in candidates:
-        if path.exists():
-            return path.resolve()
-
-    # Try finding in PATH
-    soup_go = shutil.which("soup-go")
-    if soup_go:
-        return Path(soup_go)
+if TYPE_CHECKING:
+    from tofusoup.rpc.client import KVClient
 
-    return None
+# Cleanup budget for KVClient.close() once a test has already passed or failed
+_CLOSE_TIMEOUT = 2.0
 
 
-@pytest.fixture
-def soup_path() -> Path | None:
-    """Find the soup executable (Python)."""
-    soup = shutil.which("soup")
-    if soup:
-        return Path(soup)
-    return None
+async def _close_client(client: KVClient, timeout: float = _CLOSE_TIMEOUT) -> None:
+    """Close a KVClient with its own bounded wait, shielded from an outer cancellation."""
+    with contextlib.suppress(Exception):
+        await asyncio.wait_for(asyncio.shield(client.close()), timeout=timeout)
 
 
 @pytest.mark.asyncio
@@ -64,7 +45,7 @@ async def test_python_to_python(soup_path: Path | None) -> None:
 
     from tofusoup.rpc.client import KVClient
 
-    client = KVClient(server_path=str(soup_path), tls_mode="auto", tls_key_type="rsa")
+    client = KVClient(server_path=str(soup_path), tls_mode="auto", tls_key_type="ec", tls_curve=FAST_CURVE)
 
     try:
         # Set a generous timeout as Python→Python may have handshake issues
@@ -82,8 +63,7 @@ async def test_python_to_python(soup_path: Path | None) -> None:
         assert retrieved == test_value, f"Value mismatch: expected {test_value!r}, got {retrieved!r}"
 
     finally:
-        with contextlib.suppress(Exception):
-            await client.close()
+        await _close_client(client)
 
 
 @pytest.mark.skip(reason="Python client → Go server is not supported (pyvider-rpcplugin limitation)")
@@ -113,13 +93,12 @@ async def test_python_to_go(soup_go_path: Path | None) -> None:
         assert retrieved == test_value, f"Value mismatch: expected {test_value!r}, got {retrieved!r}"
 
     finally:
-        with contextlib.suppress(Exception):
-            await client.close()
+        await _close_client(client)
 
 
 @pytest.mark.asyncio
 async def test_go_to_python(
-    soup_go_path: Path | None, soup_path: Path | None, test_artifacts_dir: Path
+    soup_go_path: Path | None, soup_path: Path | None, test_artifacts_dir: Path, plugin_env: dict[str, str]
 ) -> None:
     """Test Go client → Python server by explicitly starting server and client."""
     logger.info("=" * 80)
@@ -135,11 +114,7 @@ async def test_go_to_python(
     test_dir.mkdir(exist_ok=True)
     logger.info(f"📂 Test artifacts directory: {test_dir}")
 
-    env = os.environ.copy()
-    env["KV_STORAGE_DIR"] = str(test_dir)
-    env["LOG_LEVEL"] = "INFO"
-    env["BASIC_PLUGIN"] = "hello"
-    env["PLUGIN_MAGIC_COOKIE_KEY"] = "BASIC_PLUGIN"
+    env = {**plugin_env, "KV_STORAGE_DIR": str(test_dir)}
 
     # 1. Start the Python server with mTLS enabled
     # Use TCP transport to work around Unix socket issues in pyvider-rpcplugin
@@ -157,40 +132,18 @@ async def test_go_to_python(
     ]
     logger.info(f"🚀 Starting Python server with command: {' '.join(server_command)}")
     logger.info("🔐 TLS Configuration: mode=auto, curve=secp256r1 (P-256)")
-    server_process = subprocess.Popen(
-        server_command, env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+    server_process = await asyncio.create_subprocess_exec(
+        *server_command, env=env, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
     )
 
     # Wait for the server to start and output its handshake
     # Handshake format: core_version|protocol_version|network|address|protocol|cert
     # Example: 1|1|tcp|127.0.0.1:54321|grpc|CERT_BASE64
     logger.info("⏳ Waiting for Python server handshake...")
-    handshake_line = ""
-    timeout_seconds = 30
-    start_time = time.time()
-    while time.time() - start_time < timeout_seconds:
-        line = server_process.stdout.readline()
-        if line:
-            # Look for the go-plugin handshake pattern: starts with "1|1|tcp|" or "1|1|unix|"
-            if (
-                line.startswith("1|1|tcp|")
-                or line.startswith("1|1|unix|")
-                or "|tcp|" in line
-                or "|unix|" in line
-            ):
-                handshake_line = line.strip()
-                break
-        else:
-            # If no line, give the server a moment to produce output
-            await asyncio.sleep(0.1)
-
-        # Check if the process has terminated prematurely
-        if server_process.poll() is not None:
-            stderr_output = server_process.stderr.read()
-            logger.error(f"❌ Server terminated prematurely! Stderr: {stderr_output}")
-            raise AssertionError(f"Server process terminated prematurely. Stderr: {stderr_output}")
+    handshake_line = await read_handshake(server_process, timeout=30)
 
     assert handshake_line, "Python server did not output handshake line"
+    drain = drain_output(server_process)
 
     # Verify handshake format
     parts = handshake_line.split("|")
@@ -226,18 +179,18 @@ async def test_go_to_python(
     logger.info(f"   Value: {put_value}")
     logger.info("   TLS: Auto-detect curve from server cert (should detect P-256)")
 
-    put_result = subprocess.run(put_command, env=env, capture_output=True, text=True, timeout=10)
+    put_result = await run_go_client(put_command, env)
 
     if put_result.returncode != 0:
         logger.error("❌ Go client PUT failed!")
         logger.error(f"   Exit code: {put_result.returncode}")
-        logger.error(f"   Stdout: {put_result.stdout}")
-        logger.error(f"   Stderr: {put_result.stderr}")
+        logger.error(f"   Stdout: {put_result.stdout.decode(errors='replace')}")
+        logger.error(f"   Stderr: {put_result.stderr.decode(errors='replace')}")
     else:
-        logger.info(f"   Output: {put_result.stdout.strip()}")
+        logger.info(f"   Output: {put_result.stdout.strip().decode(errors='replace')}")
 
-    assert put_result.returncode == 0, f"Go client Put failed: {put_result.stderr}"
-    assert f"Key {put_key} put successfully." in put_result.stdout
+    assert put_result.returncode == 0, f"Go client Put failed: {put_result.stderr.decode(errors='replace')}"
+    assert f"Key {put_key} put successfully.".encode() in put_result.stdout
 
     # 3. Run the Go client to get the value
     get_command = [
@@ -254,23 +207,22 @@ async def test_go_to_python(
     logger.info(f"   Key: {put_key}")
     logger.info(f"   Expected value: {put_value}")
 
-    get_result = subprocess.run(get_command, env=env, capture_output=True, text=True, timeout=10)
+    get_result = await run_go_client(get_command, env)
 
     if get_result.returncode != 0:
         logger.error("❌ Go client GET failed!")
         logger.error(f"   Exit code: {get_result.returncode}")
-        logger.error(f"   Stdout: {get_result.stdout}")
-        logger.error(f"   Stderr: {get_result.stderr}")
+        logger.error(f"   Stdout: {get_result.stdout.decode(errors='replace')}")
+        logger.error(f"   Stderr: {get_result.stderr.decode(errors='replace')}")
     else:
-        logger.info(f"   Retrieved value: {get_result.stdout.strip()}")
+        logger.info(f"   Retrieved value: {get_result.stdout.strip().decode(errors='replace')}")
 
-    assert get_result.returncode == 0, f"Go client Get failed: {get_result.stderr}"
-    assert put_value in get_result.stdout
+    assert get_result.returncode == 0, f"Go client Get failed: {get_result.stderr.decode(errors='replace')}"
+    assert put_value.encode() in get_result.stdout
 
     # Clean up server process
     logger.info("🛑 Terminating Python server...")
-    server_process.terminate()
-    server_process.wait(timeout=5)
+    await stop_server(server_process, drain)
     assert server_process.returncode is not None, "Python server process did not terminate"
 
     logger.info("=" * 80)
@@ -279,7 +231,9 @@ async def test_go_to_python(
 
 @pytest.mark.asyncio
 @pytest.mark.skip(reason="Go server terminates after first request in standalone mode")
-async def test_go_to_go(soup_go_path: Path | None, test_artifacts_dir: Path) -> None:
+async def test_go_to_go(
+    soup_go_path: Path | None, test_artifacts_dir: Path, plugin_env: dict[str, str]
+) -> None:
     """Test Go client → Go server using direct CLI calls.
 
     SKIPPED: The Go server (soup-go rpc kv server) terminates after handling the first
@@ -291,10 +245,6 @@ async def test_go_to_go(soup_go_path: Path | None, test_artifacts_dir: Path) ->
 
     Workaround: Use single-connection scenarios or fix Go server to have --persistent flag.
     """
-    import os
-    import subprocess
-    import time
-
     if soup_go_path is None:
         pytest.skip("soup-go executable not found")
 
@@ -305,37 +255,18 @@ async def test_go_to_go(soup_go_path: Path | None, test_artifacts_dir: Path) ->
     test_dir = test_artifacts_dir / "go_to_go"
     test_dir.mkdir(exist_ok=True)
 
-    env = os.environ.copy()
-    env["KV_STORAGE_DIR"] = str(test_dir)
-    env["LOG_LEVEL"] = "INFO"
-    env["BASIC_PLUGIN"] = "hello"
-    env["PLUGIN_MAGIC_COOKIE_KEY"] = "BASIC_PLUGIN"
+    env = {**plugin_env, "KV_STORAGE_DIR": str(test_dir)}
 
     # 1. Start the Go server
     server_command = [str(soup_go_path), "rpc", "kv", "server", "--tls-mode", "auto"]
     logger.info(f"🚀 Starting Go server: {' '.join(server_command)}")
-    server_process = subprocess.Popen(
-        server_command, env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+    server_process = await asyncio.create_subprocess_exec(
+        *server_command, env=env, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
     )
 
-    # Wait for handshake
-    handshake_line = ""
-    timeout_seconds = 10
-    start_time = time.time()
-    while time.time() - start_time < timeout_seconds:
-        line = server_process.stdout.readline()
-        if line and (
-            line.startswith("1|1|tcp|") or line.startswith("1|1|unix|") or "|tcp|" in line or "|unix|" in line
-        ):
-            handshake_line = line.strip()
-            break
-        await asyncio.sleep(0.1)
-
-        if server_process.poll() is not None:
-            stderr_output = server_process.stderr.read()
-            raise AssertionError(f"Go server terminated prematurely. Stderr: {stderr_output}")
-
+    handshake_line = await read_handshake(server_process, timeout=10)
     assert handshake_line, "Go server did not output handshake"
+    drain = drain_output(server_process)
 
     try:
         # 2. PUT using Go client
@@ -352,20 +283,23 @@ async def test_go_to_go(soup_go_path: Path | None, test_artifacts_dir: Path) ->
             put_key,
             put_value,
         ]
-        put_result = subprocess.run(put_command, env=env, capture_output=True, text=True, timeout=10)
-        assert put_result.returncode == 0, f"Go client PUT failed: {put_result.stderr}"
-        assert f"Key {put_key} put successfully." in put_result.stdout
+        put_result = await run_go_client(put_command, env)
+        assert put_result.returncode == 0, (
+            f"Go client PUT failed: {put_result.stderr.decode(errors='replace')}"
+        )
+        assert f"Key {put_key} put successfully.".encode() in put_result.stdout
 
         # 3. GET using Go client
         logger.info(f"📥 GET: {put_key}")
         get_command = [str(soup_go_path), "rpc", "kv", "get", f"--address={handshake_line}", put_key]
-        get_result = subprocess.run(get_command, env=env, capture_output=True, text=True, timeout=10)
-        assert get_result.returncode == 0, f"Go client GET failed: {get_result.stderr}"
-        assert put_value in get_result.stdout
+        get_result = await run_go_client(get_command, env)
+        assert get_result.returncode == 0, (
+            f"Go client GET failed: {get_result.stderr.decode(errors='replace')}"
+        )
+        assert put_value.encode() in get_result.stdout
 
     finally:
-        server_process.terminate()
-        server_process.wait(timeout=5)
+        await stop_server(server_process, drain)
         logger.info("🛑 Go server stopped")
 
     logger.info("=" * 80)
@@ -18,8 +18,6 @@ Test Matrix:
 import asyncio
 import os
 from pathlib import Path
-import subprocess
-import time
 
 import grpc.aio
 from provide.foundation import logger
@@ -28,16 +26,7 @@ import pytest
 from tofusoup.rpc.client import KVClient
 from tofusoup.rpc.server import serve
 
-
-@pytest.fixture
-def soup_path() -> Path | None:
-    """Find the soup executable (Python)."""
-    import shutil
-
-    soup = shutil.which("soup")
-    if soup:
-        return Path(soup)
-    return None
+from .plugin_process import drain_output, read_handshake, run_go_client, stop_server
 
 
 class TestCrossLanguageInterop:
@@ -154,7 +143,11 @@ class TestCrossLanguageInterop:
     @pytest.mark.harness_python
     @pytest.mark.skipif(os.getenv("SKIP_GO_TESTS"), reason="Go tests skipped")
     async def test_go_client_python_server(
-        self, go_client_path: str, soup_path: Path | None, test_artifacts_dir: Path
+        self,
+        go_client_path: str,
+        soup_path: Path | None,
+        test_artifacts_dir: Path,
+        plugin_env: dict[str, str],
     ) -> None:
         """Test: Go Client ↔ Python Server by explicitly starting server and client."""
         if not go_client_path:
@@ -166,11 +159,7 @@ class TestCrossLanguageInterop:
         test_dir = test_artifacts_dir / "go_client_python_server"
         test_dir.mkdir(exist_ok=True)
 
-        env = os.environ.copy()
-        env["KV_STORAGE_DIR"] = str(test_dir)
-        env["LOG_LEVEL"] = "INFO"
-        env["BASIC_PLUGIN"] = "hello"
-        env["PLUGIN_MAGIC_COOKIE_KEY"] = "BASIC_PLUGIN"
+        env = {**plugin_env, "KV_STORAGE_DIR": str(test_dir)}
 
         # 1. Start the Python server
         server_command = [
@@ -183,35 +172,14 @@ class TestCrossLanguageInterop:
             "--tls-curve",
             "secp256r1",
         ]
-        server_process = subprocess.Popen(
-            server_command, env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+        server_process = await asyncio.create_subprocess_exec(
+            *server_command, env=env, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
         )
 
         # Wait for the server to start and output its handshake
-        handshake_line = ""
-        timeout_seconds = 30
-        start_time = time.time()
-        while time.time() - start_time < timeout_seconds:
-            line = server_process.stdout.readline()
-            if line:
-                # Look for the go-plugin handshake pattern: starts with "1|1|tcp|" or "1|1|unix|"
-                if (
-                    line.startswith("1|1|tcp|")
-                    or line.startswith("1|1|unix|")
-                    or "|tcp|" in line
-                    or "|unix|" in line
-                ):
-                    handshake_line = line.strip()
-                    break
-            else:
-                # If no line, give the server a moment to produce output
-                await asyncio.sleep(0.1)
-
-            # Check if the process has terminated prematurely
-            if server_process.poll() is not None:
-                stderr_output = server_process.stderr.read()
-                raise AssertionError(f"Server process terminated prematurely. Stderr: {stderr_output}")
+        handshake_line = await read_handshake(server_process, timeout=30)
         assert handshake_line, "Python server did not output handshake line"
+        drain = drain_output(server_process)
 
         # Extract port from handshake line
         parts = handshake_line.split("|")
@@ -232,9 +200,11 @@ class TestCrossLanguageInterop:
             put_key,
             put_value,
         ]
-        put_result = subprocess.run(put_command, env=env, capture_output=True, text=True, timeout=10)
-        assert put_result.returncode == 0, f"Go client Put failed: {put_result.stderr}"
-        assert f"Key {put_key} put successfully." in put_result.stdout
+        put_result = await run_go_client(put_command, env)
+        assert put_result.returncode == 0, (
+            f"Go client Put failed: {put_result.stderr.decode(errors='replace')}"
+        )
+        assert f"Key {put_key} put successfully.".encode() in put_result.stdout
 
         # 3. Run the Go client to get the value
         get_command = [
@@ -245,13 +215,14 @@ class TestCrossLanguageInterop:
             f"--address={handshake_line}",  # Pass full handshake with certificate
             put_key,
         ]
-        get_result = subprocess.run(get_command, env=env, capture_output=True, text=True, timeout=10)
-        assert get_result.returncode == 0, f"Go client Get failed: {get_result.stderr}"
-        assert put_value in get_result.stdout
+        get_result = await run_go_client(get_command, env)
+        assert get_result.returncode == 0, (
+            f"Go client Get failed: {get_result.stderr.decode(errors='replace')}"
+        )
+        assert put_value.encode() in get_result.stdout
 
         # Clean up server process
-        server_process.terminate()
-        server_process.wait(timeout=5)
+        await stop_server(server_process, drain)
         assert server_process.returncode is not None, "Python server process did not terminate"
 
     @pytest.mark.integration_rpc
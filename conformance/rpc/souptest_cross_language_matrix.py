@@ -5,104 +5,61 @@
 
 """Cross-language RPC compatibility test matrix.
 
-Tests all working language pair combinations:
-- Python → Python (secp256r1, secp384r1)
-- Python → Go (various curves)
+Tests Python client → Go server across curves. Known unsupported
+combinations are listed in conformance/rpc/README.md. Python → Python coverage for every supported
+curve lives in souptest_python_to_python.py.
 
 Note: These tests use KVClient infrastructure to test cross-language compatibility."""
 
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
 import contextlib
 from pathlib import Path
-import shutil
+from typing import TYPE_CHECKING
 
-from provide.foundation import logger
 import pytest
+import pytest_asyncio
 
-from tofusoup.rpc.client import KVClient
-
-
-@pytest.fixture
-def soup_path() -> Path | None:
-    """Find the soup executable (Python)."""
-    soup = shutil.which("soup")
-    if soup:
-        return Path(soup)
-    return None
-
-
-@pytest.fixture
-def soup_go_path() -> Path | None:
-    """Find the soup-go executable."""
-    candidates = [
-        Path("bin/soup-go"),
-        Path("harnesses/bin/soup-go"),
-        Path(__file__).parent.parent.parent / "bin" / "soup-go",
-    ]
-
-    for path in candidates:
-        if path.exists():
-            return path.resolve()
-
-    soup_go = shutil.which("soup-go")
-    if soup_go:
-        return Path(soup_go)
-
-    return None
-
-
-@pytest.mark.asyncio
-@pytest.mark.parametrize("curve", ["secp256r1", "secp384r1"])
-async def test_python_to_python_all_curves(soup_path: Path | None, curve: str) -> None:
-    """Test Python client → Python server with each supported curve."""
-    if soup_path is None:
-        pytest.skip("Python server (soup) not found in PATH")
-
-    client = KVClient(server_path=str(soup_path), tls_mode="auto", tls_key_type="ec", tls_curve=curve)
-    client.connection_timeout = 10
-
-    try:
-        await client.start()
-
-        # Verify Put/Get operations
-        test_key = f"matrix-test-{curve}"
-        test_value = f"Matrix test with {curve}".encode()
+if TYPE_CHECKING:
+    from tofusoup.rpc.client import KVClient
 
-        await client.put(test_key, test_value)
-        result = await client.get(test_key)
+# The shared clients below live on a module-scoped event loop
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
-        assert result == test_value
+_GO_PAYLOAD_TEMPLATE = b"Python->Go with %s"
 
-    finally:
-        await client.close()
 
+@pytest_asyncio.fixture(scope="module", loop_scope="module", params=["secp256r1", "secp384r1"])
+async def py2go_client(
+    request: pytest.FixtureRequest, soup_go_path: Path | None
+) -> AsyncIterator[tuple[KVClient, str]]:
+    """One started Python → Go KVClient per curve, shared by the module's tests.
 
-@pytest.mark.skip(reason="Python client → Go server is not supported (pyvider-rpcplugin limitation)")
-@pytest.mark.asyncio
-async def test_python_to_go_all_curves(soup_go_path: Path | None) -> None:
-    """Test Python client → Go server with supported curves."""
+    Yields the client and its curve."""
     if soup_go_path is None:
         pytest.skip("Go server (soup-go) not found")
 
-    for curve in ["secp256r1", "secp384r1"]:
-        client = KVClient(server_path=str(soup_go_path), tls_mode="auto", tls_key_type="ec", tls_curve=curve)
-        client.connection_timeout = 10
+    from .client_factory import automtls_client, managed_client
 
-        try:
-            await client.start()
+    curve = request.param
+    async with managed_client(automtls_client(soup_go_path, curve, connection_timeout=10)) as client:
+        yield client, curve
 
-            test_key = f"py-go-matrix-{curve}"
-            test_value = f"Python→Go with {curve}".encode()
 
-            await client.put(test_key, test_value)
-            result = await client.get(test_key)
+@pytest.mark.skip(reason="Python client → Go server is not supported (pyvider-rpcplugin limitation)")
+async def test_python_to_go_all_curves(py2go_client: tuple[KVClient, str]) -> None:
+    """Test Python client → Go server with each supported curve."""
+    client, curve = py2go_client
+    test_key = f"py-go-matrix-{curve}"
+    test_value = _GO_PAYLOAD_TEMPLATE % curve.encode()
 
-            assert result == test_value
+    await client.put(test_key, test_value)
+    result = await client.get(test_key)
 
-        finally:
-            await client.close()
+    assert result == test_value
 
 
-@pytest.mark.asyncio
 @pytest.mark.skip(reason="Python KVClient → Go server has TLS handshake issues (pyvider-rpcplugin limitation)")
 async def test_go_to_go_connection(soup_go_path: Path | None) -> None:
     """Test Go client → Go server (managed via Python KVClient).
@@ -111,7 +68,7 @@ async def test_go_to_go_connection(soup_go_path: Path | None) -> None:
     has known TLS handshake issues when connecting to Go servers. The Python client generates
     certificates that the Go server's AutoMTLS cannot validate properly.
 
-    This is a known limitation documented in test_known_unsupported_combinations().
+    This is a known limitation documented in conformance/rpc/README.md.
     Use test_go_client_python_server (interop) or manual Go client tests instead for
     Go client testing.
     """
@@ -120,10 +77,10 @@ async def test_go_to_go_connection(soup_go_path: Path | None) -> None:
     if soup_go_path is None:
         pytest.skip("Go binary (soup-go) not found")
 
-    from tofusoup.rpc.client import KVClient
+    from .client_factory import automtls_client
 
     # Create KVClient with Go server
-    client = KVClient(server_path=str(soup_go_path), tls_mode="auto", tls_key_type="ec", tls_curve="P-256")
+    client = automtls_client(soup_go_path, "P-256")
 
     try:
         await asyncio.wait_for(client.start(), timeout=15.0)
@@ -144,16 +101,4 @@ async def test_go_to_go_connection(soup_go_path: Path | None) -> None:
             await client.close()
 
 
-def test_known_unsupported_combinations() -> None:
-    """Document known unsupported combinations (don't test them, just document)."""
-    unsupported = [
-        ("python", "go", "any", "Python→Go client connections not supported (pyvider-rpcplugin bug)"),
-        ("python", "python", "secp521r1", "secp521r1 not supported by grpcio"),
-    ]
-
-    # Just document these via logger
-    for client, server, curve, reason in unsupported:
-        logger.info("Unsupported combination", client=client, server=server, curve=curve, reason=reason)
-
-
 # 🥣🔬🔚
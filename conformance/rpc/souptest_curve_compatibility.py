@@ -12,31 +12,14 @@ Consolidates test_ec_curves.py and test_all_curves.py from the project root."""
 
 from __future__ import annotations
 
-import contextlib
 from pathlib import Path
-import shutil
 
 import pytest
 
+_CURVES = ("P-256", "P-384", "P-521")
 
-@pytest.fixture
-def soup_go_path() -> Path | None:
-    """Find the soup-go executable."""
-    candidates = [
-        Path("bin/soup-go"),
-        Path("harnesses/bin/soup-go"),
-        Path(__file__).parent.parent.parent / "bin" / "soup-go",
-    ]
-
-    for path in candidates:
-        if path.exists():
-            return path.resolve()
-
-    soup_go = shutil.which("soup-go")
-    if soup_go:
-        return Path(soup_go)
-
-    return None
+# (key, value) per curve, built once at import rather than inside each test
+_PAYLOADS = {curve: (f"test-{curve.lower()}", b"Hello from %s!" % curve.encode()) for curve in _CURVES}
 
 
 @pytest.mark.skip(reason="Python client → Go server is not supported (pyvider-rpcplugin limitation)")
@@ -54,26 +37,17 @@ async def test_python_to_go_curve(soup_go_path: Path | None, curve: str) -> None
     if soup_go_path is None:
         pytest.skip("soup-go executable not found")
 
-    from tofusoup.rpc.client import KVClient
-
-    client = KVClient(server_path=str(soup_go_path), tls_mode="auto", tls_key_type="ec", tls_curve=curve)
-
-    try:
-        await client.start()
+    from .client_factory import automtls_client, managed_client
 
+    async with managed_client(automtls_client(soup_go_path, curve)) as client:
         # Test put/get operations
-        test_key = f"test-{curve.lower()}"
-        test_value = f"Hello from {curve}!".encode()
+        test_key, test_value = _PAYLOADS[curve]
 
         await client.put(test_key, test_value)
         result = await client.get(test_key)
 
         assert result == test_value, f"Value mismatch for {curve}"
 
-    finally:
-        with contextlib.suppress(Exception):
-            await client.close()
-
 
 @pytest.mark.skip(reason="Python client → Go server is not supported (pyvider-rpcplugin limitation)")
 @pytest.mark.asyncio
@@ -82,18 +56,10 @@ async def test_auto_curve(soup_go_path: Path | None) -> None:
     if soup_go_path is None:
         pytest.skip("soup-go executable not found")
 
-    from tofusoup.rpc.client import KVClient
-
-    client = KVClient(
-        server_path=str(soup_go_path),
-        tls_mode="auto",
-        tls_key_type="ec",
-        tls_curve="auto",  # Use go-plugin AutoMTLS default
-    )
-
-    try:
-        await client.start()
+    from .client_factory import automtls_client, managed_client
 
+    # Default curve "auto" uses the go-plugin AutoMTLS default
+    async with managed_client(automtls_client(soup_go_path)) as client:
         # Test put/get operations
         test_key = "test-auto-curve"
         test_value = b"Hello from auto curve!"
@@ -103,9 +69,5 @@ async def test_auto_curve(soup_go_path: Path | None) -> None:
 
         assert result == test_value
 
-    finally:
-        with contextlib.suppress(Exception):
-            await client.close()
-
 
 # 🥣🔬🔚
@@ -6,45 +6,49 @@
 """Test elliptic curve support across different server implementations.
 
 Validates:
-- Python servers support secp256r1 and secp384r1
 - Python servers reject secp521r1 (grpcio limitation)
-- Go servers support all curves (when using TLSProvider)"""
+- Go servers support all curves (when using TLSProvider)
 
+The per-runtime curve support table lives in conformance/rpc/README.md.
+Plain Python → Python put/get per supported curve is covered by
+test_python_to_python in souptest_python_to_python.py."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from provide.foundation import logger
 import pytest
+import pytest_asyncio
 
-from tofusoup.rpc.client import KVClient
+if TYPE_CHECKING:
+    from tofusoup.rpc.client import KVClient
 
+# The shared clients below live on a module-scoped event loop
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
-@pytest.mark.asyncio
-@pytest.mark.parametrize("curve", ["secp256r1", "secp384r1"])
-async def test_python_server_supported_curves(curve: str) -> None:
-    """Test that Python server accepts supported curves."""
-    server_path = Path("/Users/tim/code/gh/provide-io/pyvider/.venv/bin/soup")
+_PAYLOAD_TEMPLATE = b"Consistency test for %s"
 
-    if not server_path.exists():
-        pytest.skip(f"Python server not found: {server_path}")
 
-    client = KVClient(server_path=str(server_path), tls_mode="auto", tls_key_type="ec", tls_curve=curve)
-    client.connection_timeout = 10
+@pytest_asyncio.fixture(scope="module", loop_scope="module", params=["secp256r1", "secp384r1"])
+async def curve_client(
+    request: pytest.FixtureRequest, soup_path: Path | None
+) -> AsyncIterator[tuple[KVClient, str]]:
+    """One started Python → Python KVClient per supported curve, shared by the module's tests.
 
-    try:
-        await client.start()
-        logger.info("Successfully connected with curve", curve=curve)
+    Yields the client and its curve."""
+    if soup_path is None:
+        pytest.skip("Python server (soup) not found in PATH")
 
-        # Verify operations work
-        await client.put(f"curve-test-{curve}", b"test")
-        result = await client.get(f"curve-test-{curve}")
-        assert result == b"test"
+    from .client_factory import automtls_client, managed_client
 
-    finally:
-        await client.close()
+    curve = request.param
+    async with managed_client(automtls_client(soup_path, curve, connection_timeout=10)) as client:
+        yield client, curve
 
 
-@pytest.mark.asyncio
-async def test_python_server_rejects_secp521r1() -> None:
+async def test_python_server_rejects_secp521r1(soup_path: Path | None) -> None:
     """
     Test that secp521r1 is handled gracefully with Python server.
 
@@ -55,12 +59,12 @@ async def test_python_server_rejects_secp521r1() -> None:
     Previous behavior: Raised an exception or timed out
     Current behavior: Logs a warning and continues (more graceful)
     """
-    server_path = Path("/Users/tim/code/gh/provide-io/pyvider/.venv/bin/soup")
+    if soup_path is None:
+        pytest.skip("Python server (soup) not found in PATH")
 
-    if not server_path.exists():
-        pytest.skip(f"Python server not found: {server_path}")
+    from tofusoup.rpc.client import KVClient
 
-    client = KVClient(server_path=str(server_path), tls_mode="auto", tls_key_type="ec", tls_curve="secp521r1")
+    client = KVClient(server_path=str(soup_path), tls_mode="auto", tls_key_type="ec", tls_curve="secp521r1")
     client.connection_timeout = 10
 
     # The implementation now logs a warning instead of raising an exception
@@ -73,63 +77,20 @@ async def test_python_server_rejects_secp521r1() -> None:
         pytest.fail(f"Expected graceful handling of secp521r1, but got exception: {e}")
 
 
-@pytest.mark.asyncio
-@pytest.mark.parametrize("curve", ["secp256r1", "secp384r1"])
-async def test_curve_consistency(curve: str) -> None:
+async def test_curve_consistency(curve_client: tuple[KVClient, str]) -> None:
     """
     Test that data written with one curve can be read back.
 
     This verifies the curve is being used correctly for encryption/decryption.
     """
-    server_path = Path("/Users/tim/code/gh/provide-io/pyvider/.venv/bin/soup")
-
-    if not server_path.exists():
-        pytest.skip(f"Python server not found: {server_path}")
-
-    # Write with curve
-    client1 = KVClient(server_path=str(server_path), tls_mode="auto", tls_key_type="ec", tls_curve=curve)
-    client1.connection_timeout = 10
-
+    client, curve = curve_client
     test_key = f"consistency-{curve}"
-    test_value = f"Consistency test for {curve}".encode()
+    test_value = _PAYLOAD_TEMPLATE % curve.encode()
 
-    try:
-        await client1.start()
-        await client1.put(test_key, test_value)
-    finally:
-        await client1.close()
-
-    # Read back with same curve
-    client2 = KVClient(server_path=str(server_path), tls_mode="auto", tls_key_type="ec", tls_curve=curve)
-    client2.connection_timeout = 10
+    await client.put(test_key, test_value)
+    result = await client.get(test_key)
 
-    try:
-        await client2.start()
-        result = await client2.get(test_key)
-        assert result == test_value, f"Value mismatch for {curve}"
-    finally:
-        await client2.close()
-
-
-def test_document_curve_support() -> None:
-    """Document which curves are supported by which runtimes."""
-    support_matrix = {
-        "python": {
-            "secp256r1": True,
-            "secp384r1": True,
-            "secp521r1": False,  # grpcio limitation
-        },
-        "go": {
-            "secp256r1": True,
-            "secp384r1": True,
-            "secp521r1": True,
-        },
-    }
-
-    for runtime, curves in support_matrix.items():
-        for curve, supported in curves.items():
-            status = "supported" if supported else "not supported"
-            logger.info("Curve support", runtime=runtime, curve=curve, status=status)
+    assert result == test_value, f"Value mismatch for {curve}"
 
 
 # 🥣🔬🔚
@@ -15,7 +15,6 @@ Verifies that RPC K/V storage behaves correctly:
 import os
 from pathlib import Path
 import subprocess
-import time
 import uuid
 
 from provide.foundation import logger
@@ -122,7 +121,6 @@ class TestStorageImmutability:
 
             # Test 3: Multiple GETs retrieve same value
             logger.debug(f"GET {test_key} (second time)")
-            time.sleep(0.1)  # Small delay
             get_result_2 = subprocess.run(
                 ["soup", "rpc", "kv", "get", test_key],
                 env=env,
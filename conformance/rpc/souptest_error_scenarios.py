@@ -17,6 +17,10 @@ import pytest
 
 from tofusoup.rpc.client import KVClient
 
+from .client_factory import automtls_client
+from .server_paths import GO_SERVER_PATH, path_exists
+from .tls_defaults import FAST_CURVE
+
 
 @pytest.mark.asyncio
 async def test_python_to_go_succeeds() -> None:
@@ -25,13 +29,12 @@ async def test_python_to_go_succeeds() -> None:
 
     This was previously a known bug but has been FIXED!
     """
-    go_server = Path("bin/soup-go")
+    go_server = GO_SERVER_PATH
 
-    if not go_server.exists():
+    if not path_exists(go_server):
         pytest.skip("Go server not found at bin/soup-go")
 
-    client = KVClient(server_path=str(go_server), tls_mode="auto", tls_key_type="ec", tls_curve="P-384")
-    client.connection_timeout = 10
+    client = automtls_client(go_server, FAST_CURVE, connection_timeout=10)
 
     try:
         await client.start()
@@ -50,7 +53,7 @@ async def test_missing_server_binary_fails_early() -> None:
     """Test that missing server binary fails immediately with FileNotFoundError."""
     nonexistent = Path("/tmp/nonexistent-server-binary")
 
-    client = KVClient(server_path=str(nonexistent), tls_mode="auto", tls_key_type="ec", tls_curve="secp384r1")
+    client = KVClient(server_path=str(nonexistent), tls_mode="auto", tls_key_type="ec", tls_curve=FAST_CURVE)
 
     with pytest.raises(FileNotFoundError) as exc_info:
         await client.start()
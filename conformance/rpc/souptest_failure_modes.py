@@ -18,6 +18,8 @@ import pytest
 
 from tofusoup.rpc.client import KVClient
 
+from .server_paths import GO_SERVER_PATH, path_exists
+
 
 @pytest.mark.integration_rpc
 @pytest.mark.harness_go
@@ -34,8 +36,8 @@ async def test_short_timeouts_handled_gracefully(timeout: float) -> None:
     """
     Property test: Extremely short timeouts should fail gracefully, not crash.
     """
-    go_server = Path("bin/soup-go")
-    if not go_server.exists():
+    go_server = GO_SERVER_PATH
+    if not path_exists(go_server):
         pytest.skip("soup-go not found")
 
     client = KVClient(
@@ -75,8 +77,8 @@ async def test_invalid_curve_handled(invalid_curve: str) -> None:
     valid_curves = ["secp256r1", "secp384r1", "secp521r1", "P-256", "P-384", "P-521", "p256", "p384", "p521"]
     assume(invalid_curve not in valid_curves)
 
-    go_server = Path("bin/soup-go")
-    if not go_server.exists():
+    go_server = GO_SERVER_PATH
+    if not path_exists(go_server):
         pytest.skip("soup-go not found")
 
     client = KVClient(
@@ -130,8 +132,8 @@ async def test_empty_key_behavior(key_size: int) -> None:
     """
     Property test: Empty keys should be handled (either accepted or rejected gracefully).
     """
-    go_server = Path("bin/soup-go")
-    if not go_server.exists():
+    go_server = GO_SERVER_PATH
+    if not path_exists(go_server):
         pytest.skip("soup-go not found")
 
     client = KVClient(
@@ -18,6 +18,8 @@ import pytest
 
 from tofusoup.rpc.client import KVClient
 
+from .server_paths import GO_SERVER_PATH, path_exists
+
 # Safe key constraints
 SAFE_KEY_ALPHABET = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-_.@"
 
@@ -78,8 +80,8 @@ async def test_invalid_tls_curve_graceful_handling(invalid_curve: str) -> None:
     valid_curves = ["secp256r1", "secp384r1", "secp521r1", "P-256", "P-384", "P-521", "p256", "p384", "p521"]
     assume(invalid_curve not in valid_curves)
 
-    go_server = Path("bin/soup-go")
-    if not go_server.exists():
+    go_server = GO_SERVER_PATH
+    if not path_exists(go_server):
         pytest.skip("soup-go not found")
 
     client = KVClient(
@@ -109,8 +111,8 @@ async def test_missing_tls_mode() -> None:
 
     Non-property test for configuration validation.
     """
-    go_server = Path("bin/soup-go")
-    if not go_server.exists():
+    go_server = GO_SERVER_PATH
+    if not path_exists(go_server):
         pytest.skip("soup-go not found")
 
     # Test with potentially invalid TLS configurations
@@ -158,8 +160,8 @@ async def test_invalid_timeout_handling(timeout: float) -> None:
     - Input validation on timeouts
     - No infinite hangs
     """
-    go_server = Path("bin/soup-go")
-    if not go_server.exists():
+    go_server = GO_SERVER_PATH
+    if not path_exists(go_server):
         pytest.skip("soup-go not found")
 
     try:
@@ -205,8 +207,8 @@ async def test_path_traversal_protection(special_key: str) -> None:
     - Directory escapes
     - Security vulnerabilities
     """
-    go_server = Path("bin/soup-go")
-    if not go_server.exists():
+    go_server = GO_SERVER_PATH
+    if not path_exists(go_server):
         pytest.skip("soup-go not found")
 
     client = KVClient(
@@ -258,8 +260,8 @@ async def test_get_nonexistent_keys(operation_count: int) -> None:
     - No crashes on missing keys
     - Consistent error behavior
     """
-    go_server = Path("bin/soup-go")
-    if not go_server.exists():
+    go_server = GO_SERVER_PATH
+    if not path_exists(go_server):
         pytest.skip("soup-go not found")
 
     client = KVClient(
@@ -297,8 +299,8 @@ async def test_rapid_connect_disconnect() -> None:
 
     Non-property test for connection lifecycle.
     """
-    go_server = Path("bin/soup-go")
-    if not go_server.exists():
+    go_server = GO_SERVER_PATH
+    if not path_exists(go_server):
         pytest.skip("soup-go not found")
 
     # Rapidly create and destroy connections
@@ -14,114 +14,68 @@ and test_py_py_all_curves.py from the project root."""
 from __future__ import annotations
 
 import asyncio
+from collections.abc import AsyncIterator
 import contextlib
 from pathlib import Path
-import shutil
+from typing import TYPE_CHECKING
 
 import pytest
+import pytest_asyncio
 
-
-@pytest.fixture
-def soup_path() -> Path | None:
-    """Find the soup executable (Python)."""
-    soup = shutil.which("soup")
-    if soup:
-        return Path(soup)
-    return None
-
-
-@pytest.mark.asyncio
-async def test_python_to_python_rsa(soup_path: Path | None) -> None:
-    """Test Python client → Python server with RSA TLS."""
-    if soup_path is None:
-        pytest.skip("soup executable not found in PATH")
-
+if TYPE_CHECKING:
     from tofusoup.rpc.client import KVClient
 
-    client = KVClient(server_path=str(soup_path), tls_mode="auto", tls_key_type="rsa")
-
-    try:
-        # Set a generous timeout as Python→Python may have handshake issues
-        await asyncio.wait_for(client.start(), timeout=10.0)
-
-        # Test put
-        key = "test-py2py-rsa"
-        value = b"Hello from Python to Python with RSA!"
+# The shared clients below live on a module-scoped event loop
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
-        await client.put(key, value)
+_PAYLOAD_TEMPLATE = b"Hello from Python to Python with %s!"
 
-        # Test get
-        result = await client.get(key)
 
-        assert result == value, f"Value mismatch: expected {value!r}, got {result!r}"
-
-    finally:
-        with contextlib.suppress(Exception):
-            await client.close()
-
-
-@pytest.mark.parametrize(
-    "curve",
-    [
-        pytest.param("secp256r1", id="P-256 (secp256r1)"),
-        pytest.param("secp384r1", id="P-384 (secp384r1)"),
+@pytest_asyncio.fixture(
+    scope="module",
+    loop_scope="module",
+    params=[
+        pytest.param(("rsa", None), id="RSA"),
+        pytest.param(("ec", "secp256r1"), id="P-256 (secp256r1)"),
+        pytest.param(("ec", "secp384r1"), id="P-384 (secp384r1)"),
+        # P-384 spelled the way pyvider names its default curve (alias compatibility)
+        pytest.param(("ec", "P-384"), id="P-384 (alias)"),
     ],
 )
-@pytest.mark.asyncio
-async def test_python_to_python_ec_curve(soup_path: Path | None, curve: str) -> None:
-    """Test Python client → Python server with EC curve."""
+async def py2py_client(
+    request: pytest.FixtureRequest, soup_path: Path | None
+) -> AsyncIterator[tuple[KVClient, str]]:
+    """One started Python → Python KVClient per TLS configuration, shared by the module's tests.
+
+    Yields the client and a label naming its key type or curve."""
     if soup_path is None:
         pytest.skip("soup executable not found in PATH")
 
     from tofusoup.rpc.client import KVClient
 
-    client = KVClient(server_path=str(soup_path), tls_mode="auto", tls_key_type="ec", tls_curve=curve)
+    key_type, curve = request.param
+    tls_options = {"tls_curve": curve} if curve else {}
+    client = KVClient(server_path=str(soup_path), tls_mode="auto", tls_key_type=key_type, **tls_options)
 
     try:
-        await asyncio.wait_for(client.start(), timeout=10.0)
-
-        # Test operations
-        test_key = f"test-py2py-{curve}"
-        test_value = f"Hello from Python to Python with {curve}!".encode()
-
-        await client.put(test_key, test_value)
-        result = await client.get(test_key)
-
-        assert result == test_value, f"Value mismatch for {curve}"
-
+        # Set a generous timeout as Python→Python may have handshake issues
+        await asyncio.wait_for(client.start(), timeout=15.0)
+        yield client, curve or key_type
     finally:
         with contextlib.suppress(Exception):
             await client.close()
 
 
-@pytest.mark.asyncio
-async def test_python_to_python_p384(soup_path: Path | None) -> None:
-    """Test Python client → Python server with P-384 curve (compatibility test)."""
-    if soup_path is None:
-        pytest.skip("soup executable not found in PATH")
-
-    from tofusoup.rpc.client import KVClient
-
-    # Use P-384 which matches what pyvider uses by default
-    client = KVClient(server_path=str(soup_path), tls_mode="auto", tls_key_type="ec", tls_curve="P-384")
-
-    try:
-        await asyncio.wait_for(client.start(), timeout=15.0)
-
-        # Test put
-        key = "test-py2py"
-        value = b"Hello from Python to Python!"
-
-        await client.put(key, value)
+async def test_python_to_python(py2py_client: tuple[KVClient, str]) -> None:
+    """Test Python client → Python server with each supported TLS key configuration."""
+    client, label = py2py_client
+    test_key = f"test-py2py-{label}"
+    test_value = _PAYLOAD_TEMPLATE % label.encode()
 
-        # Test get
-        result = await client.get(key)
+    await client.put(test_key, test_value)
+    result = await client.get(test_key)
 
-        assert result == value
-
-    finally:
-        with contextlib.suppress(Exception):
-            await client.close()
+    assert result == test_value, f"Value mismatch for {label}: expected {test_value!r}, got {result!r}"
 
 
 # 🥣🔬🔚
@@ -12,13 +12,14 @@ Tests system behavior under resource pressure:
 - Disk space constraints"""
 
 import contextlib
-from pathlib import Path
 
 from hypothesis import HealthCheck, given, settings, strategies as st
 import pytest
 
 from tofusoup.rpc.client import KVClient
 
+from .server_paths import GO_SERVER_PATH, path_exists
+
 # Safe key constraints
 SAFE_KEY_ALPHABET = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-_.@"
 MAX_KEY_LENGTH = 200
@@ -44,8 +45,8 @@ async def test_large_payload_handling(payload_size: int) -> None:
     - OOM crashes
     - Proper error handling for oversized data
     """
-    go_server = Path("bin/soup-go")
-    if not go_server.exists():
+    go_server = GO_SERVER_PATH
+    if not path_exists(go_server):
         pytest.skip("soup-go not found")
 
     client = KVClient(
@@ -99,8 +100,8 @@ async def test_many_keys_storage(num_keys: int) -> None:
     - File descriptor limits
     - Directory entry limits
     """
-    go_server = Path("bin/soup-go")
-    if not go_server.exists():
+    go_server = GO_SERVER_PATH
+    if not path_exists(go_server):
         pytest.skip("soup-go not found")
 
     client = KVClient(
@@ -155,8 +156,8 @@ async def test_repeated_overwrites_memory(value_size: int, num_writes: int) -> N
     - Proper resource cleanup
     - File handle leaks
     """
-    go_server = Path("bin/soup-go")
-    if not go_server.exists():
+    go_server = GO_SERVER_PATH
+    if not path_exists(go_server):
         pytest.skip("soup-go not found")
 
     client = KVClient(
@@ -199,8 +200,8 @@ async def test_connection_limit_handling() -> None:
 
     Non-property test for connection limits.
     """
-    go_server = Path("bin/soup-go")
-    if not go_server.exists():
+    go_server = GO_SERVER_PATH
+    if not path_exists(go_server):
         pytest.skip("soup-go not found")
 
     # Try to create many connections (may hit ulimit)
@@ -260,8 +261,8 @@ async def test_binary_data_integrity(binary_pattern: bytes) -> None:
     - Encoding issues
     - Null byte handling in values
     """
-    go_server = Path("bin/soup-go")
-    if not go_server.exists():
+    go_server = GO_SERVER_PATH
+    if not path_exists(go_server):
         pytest.skip("soup-go not found")
 
     client = KVClient(
@@ -19,6 +19,7 @@ This is the CORRECT way to test RPC - using the proper abstractions
 instead of manually managing processes and handshakes.
 """
 
+import asyncio
 import os
 from pathlib import Path
 import shutil
@@ -173,14 +174,13 @@ class TestRPCKVMatrix:
             # Store multiple keys
             keys = {f"key-{i}": f"value-{i}".encode() for i in range(5)}
 
-            # PUT all keys
-            for key, value in keys.items():
-                await client.put(key, value)
+            # PUT all keys; the keys are independent, so the RPCs share the channel concurrently
+            await asyncio.gather(*(client.put(key, value) for key, value in keys.items()))
 
             # GET all keys and verify
-            for key, expected_value in keys.items():
-                retrieved_value = await client.get(key)
-                assert retrieved_value == expected_value
+            retrieved_values = await asyncio.gather(*(client.get(key) for key in keys))
+            for (key, expected_value), retrieved_value in zip(keys.items(), retrieved_values, strict=True):
+                assert retrieved_value == expected_value, f"Value mismatch for {key}"
 
         finally:
             await client.close()
@@ -14,12 +14,11 @@ Uses hypothesis to generate extreme edge cases and stress test the RPC implement
 
 This is designed to "abuse" the integration and find breaking points."""
 
-from pathlib import Path
-
 from hypothesis import HealthCheck, given, settings, strategies as st
 import pytest
 
-from tofusoup.rpc.client import KVClient
+from .client_pool import KVClientPool
+from .server_paths import GO_SERVER_PATH, path_exists
 
 # Hypothesis strategies for aggressive testing
 # NOTE: Keys must be filesystem-safe (ASCII alphanumeric + safe punctuation)
@@ -61,7 +60,9 @@ curves = st.sampled_from(["P-256", "P-384", "P-521"])
     suppress_health_check=[HealthCheck.function_scoped_fixture, HealthCheck.too_slow],
 )
 @pytest.mark.asyncio
-async def test_rpc_handles_extreme_data(key: str, value: bytes, curve: str) -> None:
+async def test_rpc_handles_extreme_data(
+    kv_client_pool: KVClientPool, key: str, value: bytes, curve: str
+) -> None:
     """
     Property test: RPC should handle any valid key/value pair without crashing.
 
@@ -71,30 +72,25 @@ async def test_rpc_handles_extreme_data(key: str, value: bytes, curve: str) -> N
     - Binary data with null bytes
     - Unicode edge cases
     """
-    go_server = Path("bin/soup-go")
-    if not go_server.exists():
+    go_server = GO_SERVER_PATH
+    if not path_exists(go_server):
         pytest.skip("soup-go not found")
 
-    client = KVClient(
-        server_path=str(go_server),
+    # One server per curve serves every generated example instead of one per example
+    client = await kv_client_pool.get(
+        str(go_server),
+        connection_timeout=15,
         tls_mode="auto",
         tls_key_type="ec",
         tls_curve=curve,
     )
-    client.connection_timeout = 15
-
-    try:
-        await client.start()
-
-        # Put and get should work for ANY data
-        await client.put(key, value)
-        result = await client.get(key)
 
-        # Verify roundtrip is identity
-        assert result == value, f"Roundtrip failed for key={key!r}, value length={len(value)}"
+    # Put and get should work for ANY data
+    await client.put(key, value)
+    result = await client.get(key)
 
-    finally:
-        await client.close()
+    # Verify roundtrip is identity
+    assert result == value, f"Roundtrip failed for key={key!r}, value length={len(value)}"
 
 
 @pytest.mark.integration_rpc
@@ -110,37 +106,28 @@ async def test_rpc_handles_extreme_data(key: str, value: bytes, curve: str) -> N
 )
 @settings(max_examples=20, deadline=60000, suppress_health_check=[HealthCheck.function_scoped_fixture])
 @pytest.mark.asyncio
-async def test_rpc_handles_rapid_operations(keys_and_values: list[tuple[str, bytes]]) -> None:
+async def test_rpc_handles_rapid_operations(
+    kv_client_pool: KVClientPool, keys_and_values: list[tuple[str, bytes]]
+) -> None:
     """
     Property test: Rapid sequential K/V operations should all succeed.
 
     Tests for race conditions and state corruption.
     """
-    go_server = Path("bin/soup-go")
-    if not go_server.exists():
+    go_server = GO_SERVER_PATH
+    if not path_exists(go_server):
         pytest.skip("soup-go not found")
 
-    client = KVClient(
-        server_path=str(go_server),
-        tls_mode="auto",
-        tls_key_type="ec",
-        tls_curve="P-256",
-    )
-
-    try:
-        await client.start()
+    client = await kv_client_pool.get(str(go_server), tls_mode="auto", tls_key_type="ec", tls_curve="P-256")
 
-        # Rapidly write all values
-        for key, value in keys_and_values:
-            await client.put(key, value)
-
-        # Verify all values are still correct
-        for key, expected_value in keys_and_values:
-            result = await client.get(key)
-            assert result == expected_value, f"Data corruption for key={key}"
+    # Rapidly write all values
+    for key, value in keys_and_values:
+        await client.put(key, value)
 
-    finally:
-        await client.close()
+    # Verify all values are still correct
+    for key, expected_value in keys_and_values:
+        result = await client.get(key)
+        assert result == expected_value, f"Data corruption for key={key}"
 
 
 # 🥣🔬🔚
@@ -108,9 +108,9 @@ async def test_pyclient_goserver_no_mtls(project_root: Path, test_artifacts_dir:
     test_value = json.dumps(proof_manifest, indent=2).encode()
 
     try:
-        start_time = time.time()
+        start_time = time.perf_counter()
         await client.start()
-        connection_time = time.time() - start_time
+        connection_time = time.perf_counter() - start_time
 
         await client.put(test_key, test_value)
         retrieved = await client.get(test_key)
@@ -216,9 +216,9 @@ async def test_pyclient_goserver_with_mtls_auto(project_root: Path, test_artifac
     test_value = json.dumps(proof_manifest, indent=2).encode()
 
     try:
-        start_time = time.time()
+        start_time = time.perf_counter()
         await client.start()
-        connection_time = time.time() - start_time
+        connection_time = time.perf_counter() - start_time
 
         await client.put(test_key, test_value)
         retrieved = await client.get(test_key)
@@ -324,9 +324,9 @@ async def test_pyclient_goserver_with_mtls_ecdsa(project_root: Path, test_artifa
     test_value = json.dumps(proof_manifest, indent=2).encode()
 
     try:
-        start_time = time.time()
+        start_time = time.perf_counter()
         await client.start()
-        connection_time = time.time() - start_time
+        connection_time = time.perf_counter() - start_time
 
         await client.put(test_key, test_value)
         retrieved = await client.get(test_key)
@@ -419,9 +419,9 @@ async def test_pyclient_pyserver_no_mtls(project_root: Path, test_artifacts_dir:
     test_value = json.dumps(proof_manifest, indent=2).encode()
 
     try:
-        start_time = time.time()
+        start_time = time.perf_counter()
         await client.start()
-        connection_time = time.time() - start_time
+        connection_time = time.perf_counter() - start_time
 
         await client.put(test_key, test_value)
         retrieved = await client.get(test_key)
@@ -518,9 +518,9 @@ async def test_pyclient_pyserver_with_mtls(project_root: Path, test_artifacts_di
     test_value = json.dumps(proof_manifest, indent=2).encode()
 
     try:
-        start_time = time.time()
+        start_time = time.perf_counter()
         await client.start()
-        connection_time = time.time() - start_time
+        connection_time = time.perf_counter() - start_time
 
         await client.put(test_key, test_value)
         retrieved = await client.get(test_key)
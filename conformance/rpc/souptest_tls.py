@@ -10,13 +10,14 @@ Tests that certificate generation works correctly across:
 - Different key types
 - Rapid generation/destruction cycles"""
 
-from pathlib import Path
-
 from hypothesis import HealthCheck, given, settings, strategies as st
 import pytest
 
 from tofusoup.rpc.client import KVClient
 
+from .client_factory import automtls_client
+from .server_paths import GO_SERVER_PATH, path_exists
+
 curves = st.sampled_from(["secp256r1", "secp384r1", "secp521r1", "P-256", "P-384", "P-521"])
 key_types = st.sampled_from(["ec", "rsa"])
 
@@ -39,8 +40,8 @@ async def test_tls_cert_generation_all_combinations(curve: str, key_type: str) -
 
     Note: RSA doesn't use curve parameter, but we test it anyway to ensure it's ignored gracefully.
     """
-    go_server = Path("bin/soup-go")
-    if not go_server.exists():
+    go_server = GO_SERVER_PATH
+    if not path_exists(go_server):
         pytest.skip("soup-go not found")
 
     # RSA doesn't use curves, but the API should handle it gracefully
@@ -82,18 +83,13 @@ async def test_rapid_cert_generation_cycles(iterations: int) -> None:
     - Cert generation race conditions
     - Cleanup issues
     """
-    go_server = Path("bin/soup-go")
-    if not go_server.exists():
+    go_server = GO_SERVER_PATH
+    if not path_exists(go_server):
         pytest.skip("soup-go not found")
 
     # Rapidly create and destroy connections
     for i in range(iterations):
-        client = KVClient(
-            server_path=str(go_server),
-            tls_mode="auto",
-            tls_key_type="ec",
-            tls_curve="P-256",
-        )
+        client = automtls_client(go_server, "P-256")
 
         try:
             await client.start()
@@ -0,0 +1,14 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""TLS defaults for RPC tests that check connectivity rather than a specific curve.
+
+P-256 handshakes are several times cheaper than P-384 or P-521, so tests that only
+need a working mTLS connection use FAST_CURVE. Curve coverage lives in
+souptest_curve_support.py and souptest_cross_language_matrix.py."""
+
+FAST_CURVE = "secp256r1"
+
+# 🥣🔬🔚
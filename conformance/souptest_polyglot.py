@@ -8,13 +8,13 @@
 Ensures that Python and Go implementations produce identical results for the same inputs.
 This is critical for polyglot systems where different languages must interoperate."""
 
-from pathlib import Path
-
 from hypothesis import HealthCheck, given, settings, strategies as st
 import pytest
 
 from tofusoup.rpc.client import KVClient
 
+from .rpc.server_paths import GO_SERVER_PATH, path_exists
+
 # Test data strategies
 # NOTE: Keys must be filesystem-safe (Go server uses keys as filenames)
 SAFE_KEY_ALPHABET = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-_.@"
@@ -40,8 +40,8 @@ async def test_python_and_go_produce_identical_results(key: str, value: bytes) -
 
     Tests roundtrip: Python→Go→Python should be identity.
     """
-    go_server = Path("bin/soup-go")
-    if not go_server.exists():
+    go_server = GO_SERVER_PATH
+    if not path_exists(go_server):
         pytest.skip("soup-go not found")
 
     # Test 1: Write with Python client to Go server, read back
@@ -84,8 +84,8 @@ async def test_data_compatible_across_languages(key: str, value: bytes) -> None:
     Note: This test verifies logical compatibility, not that both servers share state
     (they don't - each is an independent subprocess).
     """
-    go_server = Path("bin/soup-go")
-    if not go_server.exists():
+    go_server = GO_SERVER_PATH
+    if not path_exists(go_server):
         pytest.skip("soup-go not found")
 
     import shutil
@@ -145,8 +145,8 @@ async def test_batch_operations_consistency(data: list[tuple[str, bytes]]) -> No
 
     Ensures no data corruption during rapid operations.
     """
-    go_server = Path("bin/soup-go")
-    if not go_server.exists():
+    go_server = GO_SERVER_PATH
+    if not path_exists(go_server):
         pytest.skip("soup-go not found")
 
     client = KVClient(
@@ -14,6 +14,7 @@ from __future__ import annotations
 import argparse
 import ast
 from pathlib import Path
+import re
 import sys
 from typing import Tuple
 
@@ -31,21 +32,27 @@ EXCLUDED_PATTERNS = [
     "__pycache__",
     ".egg-info",
 ]
+# Patterns ending in "/" name whole directories, so they only match at the start of a
+# path segment ("site/" must not exclude "website/"); the rest match anywhere
+EXCLUDED_RE = re.compile(
+    "|".join(
+        ("(?:^|/)" if pattern.endswith("/") else "") + re.escape(pattern) for pattern in EXCLUDED_PATTERNS
+    )
+)
 
 
 def check_header_correctness(content: str) -> Tuple[bool, str]:
     """Check if existing header is correct. Returns (is_correct, issue)."""
-    lines = content.split('\n')[:15]
+    lines = content.split('\n', 15)[:15]
 
     # Check for SPDX format
-    has_spdx = any('SPDX-FileCopyrightText' in line for line in lines)
+    copyright_line = next((l for l in lines if 'SPDX-FileCopyrightText' in l), None)
     has_license = any('SPDX-License-Identifier: Apache-2.0' in line for line in lines)
 
-    if not has_spdx or not has_license:
+    if copyright_line is None or not has_license:
         return False, "Missing SPDX tags or incorrect license"
 
     # Check year and company
-    copyright_line = next((l for l in lines if 'SPDX-FileCopyrightText' in l), '')
     if '2025' not in copyright_line:
         return False, "Incorrect year (not 2025)"
     if 'provide.io llc' not in copyright_line:
@@ -54,19 +61,17 @@ def check_header_correctness(content: str) -> Tuple[bool, str]:
     return True, ""
 
 
-def should_skip_file(file_path: Path) -> Tuple[bool, str]:
+def should_skip_file(file_path: Path, content: str) -> Tuple[bool, str]:
     """Determine if file should be skipped. Returns (should_skip, reason)."""
     # Check exclusion patterns
-    for pattern in EXCLUDED_PATTERNS:
-        if pattern in str(file_path):
-            return True, f"matches exclusion pattern: {pattern}"
+    excluded = EXCLUDED_RE.search(str(file_path))
+    if excluded:
+        return True, f"matches exclusion pattern: {excluded.group()}"
 
-    # Skip nearly empty __init__.py files (namespace packages)
-    if file_path.name == "__init__.py":
-        content = file_path.read_text()
-        lines = content.strip().split('\n')
-        if len(lines) <= 3:
-            return True, "nearly empty namespace package"
+    # Skip nearly empty __init__.py files (namespace packages): three lines or
+    # fewer, counted without splitting the file into a list
+    if file_path.name == "__init__.py" and content.strip().count('\n') <= 2:
+        return True, "nearly empty namespace package"
 
     return False, ""
 
@@ -76,28 +81,31 @@ def has_shebang(content: str) -> bool:
     return content.startswith("#!")
 
 
-def add_header(file_path: Path, dry_run: bool = False, verbose: bool = False) -> Tuple[bool, str]:
-    """Add SPDX header to file. Returns (modified, message)."""
+def add_header(file_path: Path, root: Path, dry_run: bool = False, verbose: bool = False) -> Tuple[bool, str]:
+    """Add SPDX header to file. Returns (modified, message).
+
+    Messages show paths relative to root, which callers resolve once per run.
+    """
     try:
         content = file_path.read_text()
-    except Exception as e:
+    except (OSError, UnicodeDecodeError) as e:
         return False, f"ERROR: Could not read {file_path}: {e}"
 
     # Check if should skip
-    skip, reason = should_skip_file(file_path)
+    skip, reason = should_skip_file(file_path, content)
     if skip:
         if verbose:
-            return False, f"  SKIP: {file_path.relative_to(Path.cwd())} ({reason})"
+            return False, f"  SKIP: {file_path.relative_to(root)} ({reason})"
         return False, ""
 
     # Check for existing headers
     if "SPDX-FileCopyrightText" in content or "Copyright" in content[:500]:
         is_correct, issue = check_header_correctness(content)
         if not is_correct:
-            return False, f"  ⚠️  WARN: {file_path.relative_to(Path.cwd())} - {issue} (manual review needed)"
+            return False, f"  ⚠️  WARN: {file_path.relative_to(root)} - {issue} (manual review needed)"
         # Header already exists and is correct
         if verbose:
-            return False, f"  SKIP: {file_path.relative_to(Path.cwd())} (already has correct header)"
+            return False, f"  SKIP: {file_path.relative_to(root)} (already has correct header)"
         return False, ""
 
     # Determine header placement
@@ -120,16 +128,16 @@ def add_header(file_path: Path, dry_run: bool = False, verbose: bool = False) ->
     try:
         ast.parse(new_content)
     except SyntaxError as e:
-        return False, f"  ERROR: {file_path.relative_to(Path.cwd())} - Invalid syntax after header: {e}"
+        return False, f"  ERROR: {file_path.relative_to(root)} - Invalid syntax after header: {e}"
 
     if dry_run:
-        return True, f"  DRY-RUN: Would add header to {file_path.relative_to(Path.cwd())}"
+        return True, f"  DRY-RUN: Would add header to {file_path.relative_to(root)}"
 
     # Write file atomically
     try:
         file_path.write_text(new_content)
-        return True, f"  ✓ Added header to {file_path.relative_to(Path.cwd())}"
-    except Exception as e:
+        return True, f"  ✓ Added header to {file_path.relative_to(root)}"
+    except OSError as e:
         return False, f"  ERROR: Could not write {file_path}: {e}"
 
 
@@ -138,7 +146,7 @@ def find_python_files(root: Path) -> list[Path]:
     files = []
     for pattern in ["src/**/*.py", "scripts/*.py", "tests/*.py"]:
         for p in root.glob(pattern):
-            if not any(excl in str(p) for excl in EXCLUDED_PATTERNS):
+            if not EXCLUDED_RE.search(str(p)):
                 files.append(p)
     return sorted(set(files))
 
@@ -175,7 +183,7 @@ def main() -> int:
     warnings = 0
 
     for file_path in python_files:
-        was_modified, message = add_header(file_path, dry_run=args.dry_run, verbose=args.verbose)
+        was_modified, message = add_header(file_path, root, dry_run=args.dry_run, verbose=args.verbose)
 
         if message:
             print(message)
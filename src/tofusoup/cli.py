@@ -240,14 +240,14 @@ def entry_point() -> None:
             sys.exit(0)
         except Exception as e:
             logger.error(f"Plugin server failed to start: {e}", exc_info=True)
-            with debug_log_path.open("a") as f:
-                import traceback as tb
-
-                f.write(f"Exception: {e!s}\n")
-                f.write(tb.format_exc())
             import traceback
 
-            traceback.print_exc()
+            # Format the traceback once and reuse it for both the debug log and stderr
+            formatted_tb = traceback.format_exc()
+            with debug_log_path.open("a") as f:
+                f.write(f"Exception: {e!s}\n")
+                f.write(formatted_tb)
+            sys.stderr.write(formatted_tb)
             sys.exit(1)
 
     # Normal CLI invocation - initialize Foundation for CLI mode
@@ -5,7 +5,10 @@
 
 """Configuration loading and management for TofuSoup."""
 
+import copy
+import os
 import pathlib
+import stat
 import tomllib
 from typing import Any
 
@@ -52,24 +55,58 @@ class TofuSoupConfig(RuntimeConfig):
             return cls(project_root=project_root, config_file=explicit_config_file)
 
 
-def _load_config_from_file(file_path: pathlib.Path) -> dict[str, Any] | None:
+# Parsed TOML keyed by (path, mtime_ns, size), oldest entries evicted first
+_TOML_CACHE: dict[tuple[pathlib.Path, int, int], dict[str, Any]] = {}
+_TOML_CACHE_SIZE = 32
+
+
+def load_toml_file(file_path: pathlib.Path) -> dict[str, Any] | None:
     """
-    Attempts to load and parse a TOML configuration file.
+    Parse a TOML file, reusing the previous parse while the file is unchanged.
+
+    The file is opened once and the cache is keyed on fstat of that open file, so
+    the key always describes the bytes that were parsed. Returns None if the path
+    does not exist or is a non-regular file that opens (e.g. a FIFO); permission
+    errors and directories raise OSError. Callers get a deep copy and may mutate
+    it freely.
     """
-    if not file_path.is_file():
+    try:
+        f = file_path.open("rb")
+    except (FileNotFoundError, NotADirectoryError):
         return None
 
+    with f:
+        st = os.fstat(f.fileno())
+        if not stat.S_ISREG(st.st_mode):
+            return None
+
+        key = (file_path, st.st_mtime_ns, st.st_size)
+        config = _TOML_CACHE.get(key)
+        if config is None:
+            logger.info(f"🗣️ Parsing TofuSoup TOML configuration file: {file_path}")
+            config = tomllib.loads(f.read().decode("utf-8"))
+            if len(_TOML_CACHE) >= _TOML_CACHE_SIZE:
+                del _TOML_CACHE[next(iter(_TOML_CACHE))]
+            _TOML_CACHE[key] = config
+
+    return copy.deepcopy(config)
+
+
+def _load_config_from_file(file_path: pathlib.Path) -> dict[str, Any] | None:
+    """
+    Attempts to load and parse a TOML configuration file.
+    """
     try:
-        logger.info(f"🗣️ Parsing TofuSoup TOML configuration file: {file_path}")
-        with file_path.open("rb") as f:
-            config = tomllib.load(f)
-        logger.info(f"🗣️ Successfully loaded and parsed TOML configuration from {file_path}")
-        return config
+        config = load_toml_file(file_path)
     except tomllib.TOMLDecodeError as e:
         raise TofuSoupConfigError(f"Failed to parse TOML configuration file {file_path}: {e}") from e
     except Exception as e:
         raise TofuSoupConfigError(f"Unexpected error processing configuration file {file_path}: {e}") from e
 
+    if config is not None:
+        logger.info(f"🗣️ Successfully loaded and parsed TOML configuration from {file_path}")
+    return config
+
 
 def load_tofusoup_config(
     project_root: pathlib.Path, explicit_config_file: str | None = None
@@ -34,16 +34,18 @@ class LazyGroup(click.Group):
 
     def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
         """
-        Gets a command by name. If it's a lazy command, it's imported on-demand.
+        Gets a command by name. If it's a lazy command, it's imported on-demand
+        and registered on the group so later lookups skip the import machinery.
         """
-        if cmd_name in self.lazy_commands:
+        if cmd_name in self.lazy_commands and cmd_name not in self.commands:
             try:
                 module_path, command_name = self.lazy_commands[cmd_name]
                 module = importlib.import_module(module_path)
-                cmd: click.Command | None = getattr(module, command_name)
-                return cmd
+                cmd: click.Command = getattr(module, command_name)
             except (ImportError, AttributeError) as e:
                 raise click.UsageError(f"Error loading command '{cmd_name}': {e}") from e
+            self.add_command(cmd, cmd_name)
+            return cmd
         return super().get_command(ctx, cmd_name)
 
 
@@ -233,6 +233,30 @@ var configShowCmd = &cobra.Command{
 	},
 }
 
+var capabilitiesCmd = &cobra.Command{
+	Use:   "capabilities",
+	Short: "Report supported features as JSON",
+	Run: func(cmd *cobra.Command, args []string) {
+		json.NewEncoder(os.Stdout).Encode(harnessCapabilities())
+	},
+}
+
+// harnessCapabilities reports which feature commands are registered in this build.
+func harnessCapabilities() map[string]bool {
+	probes := map[string][]string{
+		"cty":  {"cty", "validate-value"},
+		"hcl":  {"hcl", "view"},
+		"wire": {"wire", "encode"},
+		"rpc":  {"rpc", "kv", "server"},
+	}
+	caps := make(map[string]bool, len(probes))
+	for name, path := range probes {
+		found, _, err := rootCmd.Find(path)
+		caps[name] = err == nil && found.Name() == path[len(path)-1]
+	}
+	return caps
+}
+
 var generateCmd = &cobra.Command{
 	Use:   "generate",
 	Short: "Generate test data or configurations",
@@ -279,6 +303,8 @@ func init() {
 	rootCmd.AddCommand(harnessCmd)
 	rootCmd.AddCommand(configCmd)
 	rootCmd.AddCommand(generateCmd)
+	rootCmd.AddCommand(replCmd)
+	rootCmd.AddCommand(capabilitiesCmd)
 	
 	// CTY subcommands
 	ctyCmd.AddCommand(ctyValidateCmd)
@@ -349,6 +375,7 @@ func initLogger() {
 	logger = hclog.New(&hclog.LoggerOptions{
 		Name:       "soup-go",
 		Level:      level,
+		Output:     os.Stderr,
 		Color:      hclog.AutoColor,
 		TimeFormat: "15:04:05.000",
 	})
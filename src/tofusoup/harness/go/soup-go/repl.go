@@ -0,0 +1,151 @@
+package main
+
+import (
+	"bufio"
+	"encoding/json"
+	"fmt"
+	"io"
+	"os"
+
+	"github.com/spf13/cobra"
+	"github.com/spf13/pflag"
+)
+
+// replRequest is one newline-delimited command read by `soup-go repl`.
+// Stdin is base64 encoded on the wire (encoding/json handles []byte that way).
+type replRequest struct {
+	Args  []string `json:"args"`
+	Stdin []byte   `json:"stdin"`
+}
+
+// replResponse carries the captured result of one command.
+type replResponse struct {
+	ExitCode int    `json:"exit_code"`
+	Stdout   []byte `json:"stdout"`
+	Stderr   []byte `json:"stderr"`
+}
+
+var replCmd = &cobra.Command{
+	Use:   "repl",
+	Short: "Run commands read as JSON lines from stdin",
+	Long: `Reads one JSON request per line ({"args": [...], "stdin": "<base64>"}) and
+writes one JSON response per line ({"exit_code": N, "stdout": "<base64>",
+"stderr": "<base64>"}). Lets test suites run many one-shot cty, hcl and wire
+commands in a single process instead of spawning soup-go for each.
+
+Commands that serve forever (rpc kv server) are not supported.`,
+	Args: cobra.NoArgs,
+	RunE: func(cmd *cobra.Command, args []string) error {
+		return runRepl(os.Stdin, os.Stdout)
+	},
+}
+
+func runRepl(in io.Reader, out io.Writer) error {
+	scanner := bufio.NewScanner(in)
+	scanner.Buffer(make([]byte, 0, 64*1024), 64*1024*1024)
+	encoder := json.NewEncoder(out)
+
+	for scanner.Scan() {
+		var req replRequest
+		if err := json.Unmarshal(scanner.Bytes(), &req); err != nil {
+			resp := replResponse{ExitCode: 2, Stderr: []byte(fmt.Sprintf("invalid repl request: %v\n", err))}
+			if err := encoder.Encode(resp); err != nil {
+				return err
+			}
+			continue
+		}
+
+		resp, err := executeReplRequest(req)
+		if err != nil {
+			return err
+		}
+		if err := encoder.Encode(resp); err != nil {
+			return err
+		}
+	}
+	return scanner.Err()
+}
+
+// executeReplRequest runs one command against the shared command tree with
+// stdin, stdout and stderr redirected to temporary files.
+func executeReplRequest(req replRequest) (replResponse, error) {
+	stdin, err := replTempFile(req.Stdin)
+	if err != nil {
+		return replResponse{}, err
+	}
+	defer removeReplTempFile(stdin)
+	stdout, err := replTempFile(nil)
+	if err != nil {
+		return replResponse{}, err
+	}
+	defer removeReplTempFile(stdout)
+	stderr, err := replTempFile(nil)
+	if err != nil {
+		return replResponse{}, err
+	}
+	defer removeReplTempFile(stderr)
+
+	origStdin, origStdout, origStderr := os.Stdin, os.Stdout, os.Stderr
+	os.Stdin, os.Stdout, os.Stderr = stdin, stdout, stderr
+	defer func() {
+		os.Stdin, os.Stdout, os.Stderr = origStdin, origStdout, origStderr
+		initLogger()
+	}()
+
+	// Flag values live in package-level variables and survive between
+	// Execute calls, so every request starts from the declared defaults.
+	resetReplFlags(rootCmd)
+	// The logger writes to whatever os.Stderr was when it was built, so
+	// rebuild it to send this request's logs to the captured stderr.
+	initLogger()
+	rootCmd.SetArgs(req.Args)
+
+	resp := replResponse{}
+	if err := rootCmd.Execute(); err != nil {
+		fmt.Fprintln(stderr, err)
+		resp.ExitCode = 1
+	}
+
+	if resp.Stdout, err = os.ReadFile(stdout.Name()); err != nil {
+		return replResponse{}, err
+	}
+	if resp.Stderr, err = os.ReadFile(stderr.Name()); err != nil {
+		return replResponse{}, err
+	}
+	return resp, nil
+}
+
+func resetReplFlags(cmd *cobra.Command) {
+	reset := func(f *pflag.Flag) {
+		_ = f.Value.Set(f.DefValue)
+		f.Changed = false
+	}
+	cmd.PersistentFlags().VisitAll(reset)
+	cmd.Flags().VisitAll(reset)
+	for _, child := range cmd.Commands() {
+		resetReplFlags(child)
+	}
+}
+
+func replTempFile(content []byte) (*os.File, error) {
+	f, err := os.CreateTemp("", "soup-go-repl-*")
+	if err != nil {
+		return nil, err
+	}
+	if len(content) > 0 {
+		if _, err := f.Write(content); err != nil {
+			removeReplTempFile(f)
+			return nil, err
+		}
+		if _, err := f.Seek(0, io.SeekStart); err != nil {
+			removeReplTempFile(f)
+			return nil, err
+		}
+	}
+	return f, nil
+}
+
+func removeReplTempFile(f *os.File) {
+	f.Close()
+	os.Remove(f.Name())
+}
@@ -294,7 +294,7 @@ class KVClient:
             ConnectionError: If connection fails or times out.
             TimeoutError: If connection attempt exceeds timeout.
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         self.is_started = False
         try:
             logger.debug(f"KVClient attempting to start server: {self.server_path}")
@@ -331,10 +331,11 @@ class KVClient:
 
             # Log successful connection
             pid = getattr(self._client._process, "pid", "N/A") if self._client._process else "N/A"
-            logger.info(f"KVClient connected to server in {time.time() - start_time:.3f}s. Server PID: {pid}")
+            elapsed = time.perf_counter() - start_time
+            logger.info(f"KVClient connected to server in {elapsed:.3f}s. Server PID: {pid}")
 
         except TimeoutError as e:
-            elapsed = time.time() - start_time
+            elapsed = time.perf_counter() - start_time
             logger.error(f"KVClient connection to server timed out after {elapsed:.3f}s")
             # Safely check if process is still running (ManagedProcess may not have poll())
             if self._client and self._client._process:
@@ -359,7 +360,7 @@ class KVClient:
                 ) from e
             raise
         except Exception as e:
-            elapsed = time.time() - start_time
+            elapsed = time.perf_counter() - start_time
             logger.error(
                 f"KVClient failed to connect/start server: {type(e).__name__} - {e}",
                 exc_info=True,
@@ -55,7 +55,7 @@ class KV(kv_pb2_grpc.KVServicer):
             storage_dir = str(get_cache_dir() / "kv-store")
         self.storage_dir = storage_dir
         self.key_pattern = re.compile(r"^[a-zA-Z0-9._-]+$")
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
         logger.debug("Initialized KV servicer", storage_dir=storage_dir)
 
     def _validate_key(self, key: str) -> bool:
@@ -96,7 +96,7 @@ class KV(kv_pb2_grpc.KVServicer):
                 "protocol_version": os.getenv("PLUGIN_PROTOCOL_VERSIONS", "1"),
                 "tls_mode": os.getenv("TLS_MODE", "unknown"),
                 "timestamp": datetime.now().isoformat(),
-                "received_at": round(time.time() - self.start_time, 3),
+                "received_at": round(time.perf_counter() - self.start_time, 3),
                 # Combo identification
                 "server_language": os.getenv("SERVER_LANGUAGE", "python"),
                 "client_language": os.getenv("CLIENT_LANGUAGE", "unknown"),
@@ -5,11 +5,14 @@
 
 
 import asyncio
-import json
+import fnmatch
 import os
 import pathlib
+import subprocess
 import sys
+import tempfile
 from typing import Any, cast
+import xml.etree.ElementTree as ET
 
 import attrs
 from provide.foundation import logger
@@ -54,6 +57,56 @@ TEST_SUITE_CONFIG = {
     },
 }
 
+# Use `-o` to override configuration for these runs so pytest only collects `souptest_` files.
+_PYTEST_COMMAND_PREFIX = (sys.executable, "-m", "pytest", "-o", "python_files=souptest_*.py")
+
+
+def _has_souptest_files(root: pathlib.Path) -> bool:
+    """Return True as soon as any `souptest_*.py` file is found under root."""
+    for _dirpath, _dirnames, filenames in os.walk(root):
+        if any(fnmatch.fnmatchcase(name, "souptest_*.py") for name in filenames):
+            return True
+    return False
+
+
+def _ensure_go_harnesses(
+    harness_keys: list[str], project_root: pathlib.Path, loaded_config: dict[str, Any]
+) -> None:
+    for harness_key in harness_keys:
+        if harness_key.startswith("go-") or harness_key == "soup-go":
+            ensure_go_harness_build(harness_key, project_root, loaded_config)
+
+
+def _parse_junit_report(report_path: pathlib.Path) -> tuple[dict[str, float], list[dict[str, Any]]]:
+    """Stream a pytest JUnit XML report, returning suite totals and failed/errored test cases.
+
+    JUnit XML carries no pytest nodeid, so each failure names its test case as
+    ``<classname>::<name>`` (e.g. ``tests.test_foo.TestBar::test_baz``).
+    """
+    totals = dict.fromkeys(("tests", "failures", "errors", "skipped", "time"), 0.0)
+    failures: list[dict[str, Any]] = []
+
+    # The runner wrote this report itself, to a file it created with mkstemp
+    for _event, elem in ET.iterparse(report_path, events=("end",)):  # noqa: S314
+        if elem.tag == "testcase":
+            for child in elem:
+                if child.tag in ("failure", "error"):
+                    failures.append(
+                        {
+                            "testcase": f"{elem.get('classname', '')}::{elem.get('name', '')}",
+                            "outcome": "failed" if child.tag == "failure" else "error",
+                            "longrepr": child.text or child.get("message", ""),
+                        }
+                    )
+                    break
+            elem.clear()
+        elif elem.tag == "testsuite":
+            for key in totals:
+                totals[key] += float(elem.get(key, 0))
+            elem.clear()
+
+    return totals, failures
+
 
 async def _run_pytest_suite(
     suite_name: str,
@@ -61,41 +114,47 @@ async def _run_pytest_suite(
     suite_path_relative: str,
     pytest_args: list[str],
     env_vars: dict[str, Any],
+    base_env: dict[str, str] | None = None,
 ) -> TestSuiteResult:
     pytest_target_path = project_root / suite_path_relative
     if not pytest_target_path.exists():
         raise TofuSoupError(f"Test suite path not found: {pytest_target_path}")
 
+    # Avoid paying interpreter + plugin startup for a suite with nothing to collect
+    if not _has_souptest_files(pytest_target_path):
+        logger.info(f"No souptest_*.py files under {pytest_target_path}; skipping suite '{suite_name}'")
+        return TestSuiteResult(
+            suite_name=suite_name,
+            success=True,
+            duration=0.0,
+            passed=0,
+            failed=0,
+            skipped=0,
+            errors=0,
+        )
+
     # Use project-specific temp directory for test reports
     reports_dir = project_root / "soup" / "output" / "test-reports"
     reports_dir.mkdir(parents=True, exist_ok=True)
 
-    # Create unique report file name to support parallel test execution
-    report_path = reports_dir / f"{suite_name}-report-{os.getpid()}.json"
-
-    # Corrected invocation: Use `-o` to override configuration for this specific run.
-    # This is the correct way to tell this pytest session to only find `souptest_` files.
-    command = [
-        sys.executable,
-        "-m",
-        "pytest",
-        "--json-report",
-        f"--json-report-file={report_path}",
-        "-o",
-        "python_files=souptest_*.py",
-        *pytest_args,
-        str(pytest_target_path),
-    ]
+    # Atomically reserve a unique report file so parallel/repeated runs never collide
+    fd, report_name = tempfile.mkstemp(prefix=f"{suite_name}-report-", suffix=".xml", dir=reports_dir)
+    os.close(fd)
+    report_path = pathlib.Path(report_name)
 
-    current_env = os.environ.copy()
-    current_env.update({k: str(v) for k, v in env_vars.items()})
+    command = [*_PYTEST_COMMAND_PREFIX, f"--junit-xml={report_path}", *pytest_args, str(pytest_target_path)]
+
+    # Layer suite overrides on top of a shared base env rather than copying os.environ per suite
+    current_env = (base_env if base_env is not None else dict(os.environ)) | {
+        k: str(v) for k, v in env_vars.items()
+    }
 
     logger.debug(f"Running pytest with command: {' '.join(command)}", env=current_env)
 
-    process = await asyncio.create_subprocess_exec(
-        *command, cwd=str(project_root), stdout=None, stderr=None, env=current_env
-    )
-    await process.wait()
+    # stdout/stderr are inherited and never read, so a plain Popen reaped from a worker
+    # thread avoids setting up asyncio subprocess transports and child watchers.
+    process = subprocess.Popen(command, cwd=str(project_root), env=current_env)
+    await asyncio.to_thread(process.wait)
 
     def _get_fallback_result() -> TestSuiteResult:
         return TestSuiteResult(
@@ -106,31 +165,29 @@ async def _run_pytest_suite(
             failed=1,
             skipped=0,
             errors=1,
-            failures=[{"nodeid": "runner_error", "longrepr": "Test report processing failed"}],
+            failures=[{"testcase": "runner_error", "longrepr": "Test report processing failed"}],
         )
 
     def _process_test_report() -> TestSuiteResult:
         try:
-            with report_path.open() as f:
-                report_content = f.read()
-                if not report_content:
-                    raise ValidationError("Empty test report file")
-                report = json.loads(report_content)
+            if report_path.stat().st_size == 0:
+                # pytest exited without writing a report; drop the empty file mkstemp reserved
+                report_path.unlink()
+                raise ValidationError("Empty test report file")
+            totals, failures = _parse_junit_report(report_path)
         except FileNotFoundError as e:
             raise ResourceError(f"Test report file not found: {report_path}") from e
-        except json.JSONDecodeError as e:
-            raise ValidationError(f"Invalid JSON in test report: {e}") from e
+        except ET.ParseError as e:
+            raise ValidationError(f"Invalid JUnit XML in test report: {e}") from e
 
-        summary = report.get("summary", {})
-        failures = [test for test in report.get("tests", []) if test.get("outcome") in ("failed", "error")]
         return TestSuiteResult(
             suite_name=suite_name,
-            success=(report.get("exitcode", 1) == 0),
-            duration=report.get("duration", 0.0),
-            passed=summary.get("passed", 0),
-            failed=summary.get("failed", 0),
-            skipped=summary.get("skipped", 0),
-            errors=len(report.get("errors", [])),
+            success=(process.returncode == 0),
+            duration=totals["time"],
+            passed=int(totals["tests"] - totals["failures"] - totals["errors"] - totals["skipped"]),
+            failed=int(totals["failures"]),
+            skipped=int(totals["skipped"]),
+            errors=int(totals["errors"]),
             failures=failures,
         )
 
@@ -147,7 +204,8 @@ async def _run_pytest_suite(
     finally:
         # Keep report files for debugging - they're in a well-organized location
         # and will be cleaned up by project cleanup scripts if needed
-        logger.debug(f"Test report saved to {report_path}")
+        if report_path.exists():
+            logger.debug(f"Test report saved to {report_path}")
 
 
 async def run_test_suite(
@@ -156,14 +214,16 @@ async def run_test_suite(
     loaded_config: dict[str, Any],
     verbose: bool,
     pytest_options: list[str] | None = None,
+    base_env: dict[str, str] | None = None,
+    skip_harness_build: bool = False,
 ) -> TestSuiteResult:
     if suite_name not in TEST_SUITE_CONFIG:
         raise TofuSoupError(f"Test suite '{suite_name}' is not defined.")
 
     suite_cfg = TEST_SUITE_CONFIG[suite_name]
-    for harness_key in suite_cfg.get("required_harnesses", []):
-        if harness_key.startswith("go-") or harness_key == "soup-go":
-            ensure_go_harness_build(harness_key, project_root, loaded_config)
+    if not skip_harness_build:
+        required_harnesses = cast(list[str], suite_cfg.get("required_harnesses", []))
+        _ensure_go_harnesses(required_harnesses, project_root, loaded_config)
 
     suite_defaults = loaded_config.get("test_suite_defaults", {})
     suite_specific = loaded_config.get("test_suite", {}).get(suite_name, {})
@@ -178,13 +238,28 @@ async def run_test_suite(
         pytest_args.extend(pytest_options)
 
     suite_path = cast(str, suite_cfg["path"])
-    return await _run_pytest_suite(suite_name, project_root, suite_path, pytest_args, env_vars)
+    return await _run_pytest_suite(suite_name, project_root, suite_path, pytest_args, env_vars, base_env)
 
 
 async def run_all_test_suites(
     project_root: pathlib.Path, loaded_config: dict[str, Any], verbose: bool
 ) -> list[TestSuiteResult]:
-    tasks = [run_test_suite(name, project_root, loaded_config, verbose, None) for name in TEST_SUITE_CONFIG]
+    # Build each required harness exactly once up front so the parallel suites
+    # neither repeat the build check nor race on the same output binary.
+    required_harnesses: list[str] = []
+    for suite_cfg in TEST_SUITE_CONFIG.values():
+        for harness_key in cast(list[str], suite_cfg.get("required_harnesses", [])):
+            if harness_key not in required_harnesses:
+                required_harnesses.append(harness_key)
+    await asyncio.to_thread(_ensure_go_harnesses, required_harnesses, project_root, loaded_config)
+
+    base_env = dict(os.environ)
+    tasks = [
+        run_test_suite(
+            name, project_root, loaded_config, verbose, None, base_env=base_env, skip_harness_build=True
+        )
+        for name in TEST_SUITE_CONFIG
+    ]
     return await asyncio.gather(*tasks)
 
 
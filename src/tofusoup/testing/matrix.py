@@ -17,6 +17,7 @@ import itertools
 import json
 import os
 import pathlib
+import time
 from typing import Any
 
 from rich.console import Console
@@ -230,9 +231,10 @@ class VersionMatrix:
         self, combination: MatrixCombination, stir_directory: pathlib.Path
     ) -> MatrixResult:
         """Test a single tool version combination."""
-        import time
-
-        start_time = time.time()
+        start_time = time.perf_counter()
+        result: dict[str, Any] | None = None
+        success = False
+        error_message: str | None = None
 
         try:
             # Install all tools in this combination
@@ -240,28 +242,32 @@ class VersionMatrix:
 
             # Run soup stir with this combination
             result = await self._run_stir_test(combination, stir_directory)
-
-            duration = time.time() - start_time
-
-            return MatrixResult(
-                combination=combination,
-                success=result["success"],
-                duration_seconds=duration,
-                test_results=result,
-            )
-
+            # Read inside the try so a malformed result is recorded as a failure
+            success = result["success"]
         except Exception as e:
-            duration = time.time() - start_time
+            result = None
+            error_message = str(e)
+
+        duration = time.perf_counter() - start_time
 
+        if result is None:
             return MatrixResult(
                 combination=combination,
                 success=False,
                 duration_seconds=duration,
-                error_message=str(e),
+                error_message=error_message,
             )
 
+        return MatrixResult(
+            combination=combination,
+            success=success,
+            duration_seconds=duration,
+            test_results=result,
+        )
+
     async def _install_combination_tools(self, combination: MatrixCombination) -> None:
         """Install all tools for a specific combination."""
+        pending_installs = []
         for tool_name, version in combination.tools.items():
             manager = get_tool_manager(tool_name, self.config)
             if not manager:
@@ -276,11 +282,15 @@ class VersionMatrix:
 
             # Install the specific version
             console.print(f"Installing {tool_name} {version} for matrix testing...")
-            await asyncio.get_event_loop().run_in_executor(
-                None,
-                manager.install_version,
-                version,
-                False,  # not dry_run
+            pending_installs.append((manager, version))
+
+        # Downloads are independent, so install all missing tools concurrently
+        if pending_installs:
+            await asyncio.gather(
+                *(
+                    asyncio.to_thread(manager.install_version, version, False)  # not dry_run
+                    for manager, version in pending_installs
+                )
             )
 
     async def _run_stir_test(
@@ -12,7 +12,9 @@ Note: Matrix testing requires the optional 'wrknv' dependency."""
 
 import asyncio
 from dataclasses import dataclass, field
+import os
 from pathlib import Path
+import time
 from typing import Any
 
 from rich.console import Console
@@ -165,10 +167,11 @@ class ProfileMatrix:
 
     async def _test_single_profile(self, profile_name: str, stir_directory: Path) -> ProfileTestResult:
         """Test a single profile configuration."""
-        import os
-        import time
-
-        start_time = time.time()
+        start_time = time.perf_counter()
+        tools: dict[str, str] = {}
+        result: dict[str, Any] | None = None
+        success = False
+        error_message: str | None = None
 
         try:
             # Get profile configuration
@@ -177,7 +180,6 @@ class ProfileMatrix:
                 raise Exception(f"Profile '{profile_name}' not found")
 
             # Extract tools from profile
-            tools = {}
             terraform_flavor = profile.get(
                 "terraform_flavor", self.config.get_setting("terraform_flavor", "terraform")
             )
@@ -197,27 +199,30 @@ class ProfileMatrix:
 
             # Run soup stir with this profile
             result = await self._run_stir_test(profile_name, stir_directory, env)
-
-            duration = time.time() - start_time
-
-            return ProfileTestResult(
-                profile_name=profile_name,
-                success=result["success"],
-                duration_seconds=duration,
-                test_results=result,
-                tools=tools,
-            )
-
+            # Read inside the try so a malformed result is recorded as a failure
+            success = result["success"]
         except Exception as e:
-            duration = time.time() - start_time
+            result = None
+            error_message = str(e)
+
+        duration = time.perf_counter() - start_time
 
+        if result is None:
             return ProfileTestResult(
                 profile_name=profile_name,
                 success=False,
                 duration_seconds=duration,
-                error_message=str(e),
+                error_message=error_message,
             )
 
+        return ProfileTestResult(
+            profile_name=profile_name,
+            success=success,
+            duration_seconds=duration,
+            test_results=result,
+            tools=tools,
+        )
+
     async def _install_profile_tools(self, profile_name: str, profile: dict[str, Any]) -> None:
         """Install all tools for a specific profile."""
         # Determine which tools to install based on terraform_flavor
@@ -232,6 +237,7 @@ class ProfileMatrix:
             tools_to_install["terraform"] = profile["terraform"]
 
         # Install each tool
+        pending_installs = []
         for tool_name, version in tools_to_install.items():
             manager = get_tool_manager(tool_name, self.config)
             if not manager:
@@ -246,11 +252,15 @@ class ProfileMatrix:
 
             # Install the specific version
             console.print(f"Installing {tool_name} {version} for profile '{profile_name}'...")
-            await asyncio.get_event_loop().run_in_executor(
-                None,
-                manager.install_version,
-                version,
-                False,  # not dry_run
+            pending_installs.append((manager, version))
+
+        # Downloads are independent, so install all missing tools concurrently
+        if pending_installs:
+            await asyncio.gather(
+                *(
+                    asyncio.to_thread(manager.install_version, version, False)  # not dry_run
+                    for manager, version in pending_installs
+                )
             )
 
     async def _run_stir_test(
@@ -12,9 +12,10 @@ Note: wrknv is an optional dependency. If not installed, matrix testing features
 will be unavailable but other TofuSoup features will work normally."""
 
 from pathlib import Path
-import tomllib
 from typing import Any
 
+from tofusoup.common.config import load_toml_file
+
 # Optional wrknv import - graceful degradation if not available
 try:
     from wrknv import WorkenvConfig  # type: ignore[import-not-found]
@@ -38,13 +39,7 @@ def load_soup_config(project_root: Path | None = None) -> dict[str, Any]:
     if project_root is None:
         project_root = Path.cwd()
 
-    soup_toml_path = project_root / "soup.toml"
-
-    if soup_toml_path.exists():
-        with soup_toml_path.open("rb") as f:
-            return tomllib.load(f)
-
-    return {}
+    return load_toml_file(project_root / "soup.toml") or {}
 
 
 def create_workenv_config_with_soup(project_root: Path | None = None) -> Any:
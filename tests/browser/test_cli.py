@@ -4,7 +4,9 @@
 #
 
 
-from provide.testkit import isolated_cli_runner
+import re
+
+from click.testing import CliRunner
 import pytest
 
 from tofusoup.browser import cli as browser_cli
@@ -12,14 +14,15 @@ from tofusoup.browser import cli as browser_cli
 # Mark all tests in this module as browser tests
 pytestmark = pytest.mark.browser
 
+# Group description followed later by the tui subcommand, matched in one pass over the help text
+_SUI_HELP_RE = re.compile(r"Graphical UI for browsing Terraform and OpenTofu registries.*\btui\b", re.DOTALL)
+
 
-def test_sui_tui_command_exists() -> None:
+def test_sui_tui_command_exists(cli_runner: CliRunner) -> None:
     """Test that the sui tui command exists and has correct help text."""
-    with isolated_cli_runner() as runner:
-        result = runner.invoke(browser_cli.sui_cli, ["--help"])
-        assert result.exit_code == 0
-        assert "Graphical UI for browsing Terraform and OpenTofu registries" in result.output
-        assert "tui" in result.output
+    result = cli_runner.invoke(browser_cli.sui_cli, ["--help"])
+    assert result.exit_code == 0
+    assert _SUI_HELP_RE.search(result.output), result.output
 
 
 # 🥣🔬🔚
@@ -11,6 +11,7 @@ import sys
 from _pytest.config import Config
 from _pytest.monkeypatch import MonkeyPatch
 from _pytest.nodes import Item
+from click.testing import CliRunner
 from provide.testkit import (
     reset_foundation_setup_for_testing,
 )
@@ -89,6 +90,15 @@ def reset_foundation_for_tests() -> None:
     reset_foundation_setup_for_testing()
 
 
+@pytest.fixture(scope="session")
+def cli_runner() -> CliRunner:
+    """
+    Provides one CliRunner for the session.
+    Tests that write files should do so inside cli_runner.isolated_filesystem().
+    """
+    return CliRunner()
+
+
 @pytest.fixture(scope="session")
 def go_soup_harness_path() -> Path:
     """
@@ -0,0 +1,155 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+import xml.etree.ElementTree as ET
+
+from provide.testkit.mocking import MagicMock, patch
+import pytest
+
+from tofusoup.testing.logic import _parse_junit_report, _run_pytest_suite
+
+_JUNIT_REPORT = """<?xml version="1.0" encoding="utf-8"?>
+<testsuites>
+  <testsuite name="pytest" errors="1" failures="1" skipped="1" tests="4" time="1.25">
+    <testcase classname="tests.test_sample" name="test_pass" time="0.01" />
+    <testcase classname="tests.test_sample.TestGroup" name="test_fail" time="0.02">
+      <failure message="assert 1 == 2">def test_fail(): assert 1 == 2</failure>
+    </testcase>
+    <testcase classname="tests.test_sample" name="test_error" time="0.03">
+      <error message="failed on setup with &quot;fixture broke&quot;" />
+    </testcase>
+    <testcase classname="tests.test_sample" name="test_skip" time="0.00">
+      <skipped type="pytest.skip" message="not today">skip reason</skipped>
+    </testcase>
+  </testsuite>
+</testsuites>
+"""
+
+
+_SUITE_PATH = "conformance/sample"
+
+
+def _write_report(tmp_path: Path, content: str) -> Path:
+    report = tmp_path / "report.xml"
+    report.write_text(content)
+    return report
+
+
+def test_parse_junit_report_totals(tmp_path: Path) -> None:
+    """Suite totals come from the <testsuite> attributes."""
+    totals, _failures = _parse_junit_report(_write_report(tmp_path, _JUNIT_REPORT))
+
+    assert totals == {"tests": 4.0, "failures": 1.0, "errors": 1.0, "skipped": 1.0, "time": 1.25}
+
+
+def test_parse_junit_report_failures(tmp_path: Path) -> None:
+    """Failed and errored test cases are reported; passed and skipped ones are not."""
+    _totals, failures = _parse_junit_report(_write_report(tmp_path, _JUNIT_REPORT))
+
+    assert failures == [
+        {
+            "testcase": "tests.test_sample.TestGroup::test_fail",
+            "outcome": "failed",
+            "longrepr": "def test_fail(): assert 1 == 2",
+        },
+        {
+            "testcase": "tests.test_sample::test_error",
+            "outcome": "error",
+            # Without body text the message attribute is used
+            "longrepr": 'failed on setup with "fixture broke"',
+        },
+    ]
+
+
+def test_parse_junit_report_all_passing(tmp_path: Path) -> None:
+    report = _write_report(
+        tmp_path,
+        '<testsuites><testsuite tests="1" failures="0" errors="0" skipped="0" time="0.1">'
+        '<testcase classname="tests.test_sample" name="test_pass" /></testsuite></testsuites>',
+    )
+
+    totals, failures = _parse_junit_report(report)
+
+    assert totals["tests"] == 1.0
+    assert failures == []
+
+
+def test_parse_junit_report_missing(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        _parse_junit_report(tmp_path / "missing.xml")
+
+
+def test_parse_junit_report_malformed(tmp_path: Path) -> None:
+    with pytest.raises(ET.ParseError):
+        _parse_junit_report(_write_report(tmp_path, "<testsuites><testsuite tests="))
+
+
+def _fake_pytest(report_xml: str | None, returncode: int) -> Callable[..., MagicMock]:
+    """Stand-in for subprocess.Popen that writes report_xml to the --junit-xml path, if given."""
+
+    def popen(command: list[str], **_kwargs: Any) -> MagicMock:
+        report_arg = next(arg for arg in command if arg.startswith("--junit-xml="))
+        if report_xml is not None:
+            Path(report_arg.removeprefix("--junit-xml=")).write_text(report_xml)
+        return MagicMock(returncode=returncode)
+
+    return popen
+
+
+def _reports_dir(project_root: Path) -> Path:
+    return project_root / "soup" / "output" / "test-reports"
+
+
+@pytest.fixture
+def suite_root(tmp_path: Path) -> Path:
+    """A project root whose sample suite contains one souptest file."""
+    suite_dir = tmp_path / _SUITE_PATH
+    suite_dir.mkdir(parents=True)
+    (suite_dir / "souptest_sample.py").write_text("def test_sample():\n    pass\n")
+    return tmp_path
+
+
+async def test_run_pytest_suite_skips_suite_without_souptest_files(tmp_path: Path) -> None:
+    """A suite with nothing to collect succeeds with zero tests and never starts pytest."""
+    suite_dir = tmp_path / _SUITE_PATH
+    suite_dir.mkdir(parents=True)
+    (suite_dir / "helpers.py").write_text("")
+
+    with patch("tofusoup.testing.logic.subprocess.Popen") as mock_popen:
+        result = await _run_pytest_suite("sample", tmp_path, _SUITE_PATH, [], {})
+
+    mock_popen.assert_not_called()
+    assert result.success is True
+    assert (result.passed, result.failed, result.skipped, result.errors) == (0, 0, 0, 0)
+    assert not _reports_dir(tmp_path).exists()
+
+
+async def test_run_pytest_suite_keeps_report_on_success(suite_root: Path) -> None:
+    """A written report is parsed into the result and kept for debugging."""
+    with patch("tofusoup.testing.logic.subprocess.Popen", side_effect=_fake_pytest(_JUNIT_REPORT, 0)):
+        result = await _run_pytest_suite("sample", suite_root, _SUITE_PATH, [], {})
+
+    assert result.success is True  # pytest's exit code, not the report, decides success
+    assert (result.passed, result.failed, result.skipped, result.errors) == (1, 1, 1, 1)
+    reports = list(_reports_dir(suite_root).glob("sample-report-*.xml"))
+    assert len(reports) == 1
+    assert reports[0].read_text() == _JUNIT_REPORT
+
+
+async def test_run_pytest_suite_removes_empty_report_on_failure(suite_root: Path) -> None:
+    """If pytest dies before writing its report, the reserved empty file is removed."""
+    with patch("tofusoup.testing.logic.subprocess.Popen", side_effect=_fake_pytest(None, 2)):
+        result = await _run_pytest_suite("sample", suite_root, _SUITE_PATH, [], {})
+
+    assert result.success is False
+    assert result.failures == [{"testcase": "runner_error", "longrepr": "Test report processing failed"}]
+    assert list(_reports_dir(suite_root).iterdir()) == []
+
+
+# 🥣🔬🔚
@@ -4,36 +4,18 @@
 #
 
 
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
+
 from provide.testkit.mocking import AsyncMock
 import pytest
 
 from tofusoup.registry.models.module import Module, ModuleVersion
 from tofusoup.registry.models.provider import Provider, ProviderVersion
-from tofusoup.registry.opentofu import OpenTofuRegistry
-from tofusoup.registry.terraform import IBMTerraformRegistry
-
-
-@pytest.fixture
-def mock_terraform_registry() -> IBMTerraformRegistry:
-    """Create a mock Terraform registry."""
-    from tofusoup.registry.base import RegistryConfig
-    from tofusoup.registry.terraform import IBMTerraformRegistry
-
-    mock = AsyncMock(spec=IBMTerraformRegistry)
-    mock.config = RegistryConfig(base_url="https://registry.terraform.io")
-    return mock
-
-
-@pytest.fixture
-def mock_opentofu_registry() -> OpenTofuRegistry:
-    """Create a mock OpenTofu registry."""
-    from tofusoup.registry.opentofu import OpenTofuRegistry
-
-    mock = AsyncMock(spec=OpenTofuRegistry)
-    return mock
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_provider() -> Provider:
     """Create a sample provider for testing."""
     return Provider(
@@ -46,7 +28,7 @@ def sample_provider() -> Provider:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_provider_versions() -> list[ProviderVersion]:
     """Create sample provider versions for testing."""
     return [
@@ -56,7 +38,7 @@ def sample_provider_versions() -> list[ProviderVersion]:
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_module() -> Module:
     """Create a sample module for testing."""
     return Module(
@@ -70,7 +52,7 @@ def sample_module() -> Module:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_module_versions() -> list[ModuleVersion]:
     """Create sample module versions for testing."""
     return [
@@ -80,29 +62,33 @@ def sample_module_versions() -> list[ModuleVersion]:
     ]
 
 
-@pytest.fixture
-def mock_provider_details(sample_provider: Provider) -> dict:
-    """Create mock provider details dict for testing."""
-    return {
-        "namespace": sample_provider.namespace,
-        "name": sample_provider.name,
-        "description": sample_provider.description,
-        "source": sample_provider.source_url,
-        "download_count": 1000000,
-    }
+@pytest.fixture(scope="session")
+def mock_provider_details(sample_provider: Provider) -> Mapping[str, Any]:
+    """Create read-only mock provider details for testing."""
+    return MappingProxyType(
+        {
+            "namespace": sample_provider.namespace,
+            "name": sample_provider.name,
+            "description": sample_provider.description,
+            "source": sample_provider.source_url,
+            "download_count": 1000000,
+        }
+    )
 
 
-@pytest.fixture
-def mock_module_details(sample_module: Module) -> dict:
-    """Create mock module details dict for testing."""
-    return {
-        "namespace": sample_module.namespace,
-        "name": sample_module.name,
-        "provider": sample_module.provider_name,
-        "description": sample_module.description,
-        "source": sample_module.source_url,
-        "download_count": 500000,
-    }
+@pytest.fixture(scope="session")
+def mock_module_details(sample_module: Module) -> Mapping[str, Any]:
+    """Create read-only mock module details for testing."""
+    return MappingProxyType(
+        {
+            "namespace": sample_module.namespace,
+            "name": sample_module.name,
+            "provider": sample_module.provider_name,
+            "description": sample_module.description,
+            "source": sample_module.source_url,
+            "download_count": 500000,
+        }
+    )
 
 
 @pytest.fixture
@@ -117,4 +103,46 @@ def mock_module_versions(sample_module_versions: list[ModuleVersion]) -> list[Mo
     return sample_module_versions
 
 
+@pytest.fixture
+def mock_tf_registry(
+    mock_provider_details: Mapping[str, Any],
+    mock_provider_versions: list[ProviderVersion],
+    mock_module_details: Mapping[str, Any],
+    mock_module_versions: list[ModuleVersion],
+    monkeypatch: pytest.MonkeyPatch,
+) -> AsyncMock:
+    """Patch the CLI's IBMTerraformRegistry with a mock serving the sample provider and module."""
+    instance = AsyncMock()
+    instance.get_provider_details = AsyncMock(return_value=mock_provider_details)
+    instance.list_provider_versions = AsyncMock(return_value=mock_provider_versions)
+    instance.get_module_details = AsyncMock(return_value=mock_module_details)
+    instance.list_module_versions = AsyncMock(return_value=mock_module_versions)
+    instance.__class__.__name__ = "IBMTerraformRegistry"
+
+    def factory(*args: Any, **kwargs: Any) -> AsyncMock:
+        return instance
+
+    monkeypatch.setattr("tofusoup.registry.cli.IBMTerraformRegistry", factory)
+    return instance
+
+
+@pytest.fixture
+def mock_tofu_registry(
+    mock_provider_details: Mapping[str, Any],
+    mock_provider_versions: list[ProviderVersion],
+    monkeypatch: pytest.MonkeyPatch,
+) -> AsyncMock:
+    """Patch the CLI's OpenTofuRegistry with a mock that knows fewer provider versions."""
+    instance = AsyncMock()
+    instance.get_provider_details = AsyncMock(return_value=mock_provider_details)
+    instance.list_provider_versions = AsyncMock(return_value=mock_provider_versions[:2])
+    instance.__class__.__name__ = "OpenTofuRegistry"
+
+    def factory(*args: Any, **kwargs: Any) -> AsyncMock:
+        return instance
+
+    monkeypatch.setattr("tofusoup.registry.cli.OpenTofuRegistry", factory)
+    return instance
+
+
 # 🥣🔬🔚
@@ -4,74 +4,98 @@
 #
 
 
+from typing import Any
+
 from provide.testkit import isolated_cli_runner
-from provide.testkit.mocking import AsyncMock, MagicMock, patch
+from provide.testkit.mocking import AsyncMock, patch
+import pytest
 
 from tofusoup.registry import cli as registry_cli
-from tofusoup.registry.models.module import Module
-from tofusoup.registry.models.provider import Provider
 from tofusoup.registry.search.engine import SearchResult
 
+pytestmark = pytest.mark.xdist_group("cli_tests")
+
+_AWS_PROVIDER_RESULT = SearchResult(
+    id="1",
+    name="aws",
+    namespace="hashicorp",
+    type="provider",
+    registry_source="terraform",
+    provider_name=None,
+    latest_version="6.8.0",
+    total_versions=446,
+    description="terraform-provider-aws",
+)
+_VPC_MODULE_RESULT = SearchResult(
+    id="2",
+    name="vpc",
+    namespace="terraform-aws-modules",
+    type="module",
+    registry_source="terraform",
+    provider_name="aws",
+    latest_version="6.0.1",
+    total_versions=231,
+    description="Terraform module to create AWS VPC resources",
+)
+
+
+def _patch_search(results: list[SearchResult]) -> Any:
+    """Patch the CLI's search coroutine so the real event loop returns results immediately."""
+    return patch("tofusoup.registry.cli.async_search_runner", new=AsyncMock(return_value=results))
+
+
+def _table_rows(output: str) -> list[list[str]]:
+    """Split the search table's data rows (everything after the header) into stripped cells."""
+    rows = [line for line in output.splitlines() if line.startswith("|")]
+    return [[cell.strip() for cell in row.strip("|").split("|")] for row in rows[1:]]
+
+
+@pytest.fixture(autouse=True)
+def _patched_registries(mock_tf_registry: AsyncMock, mock_tofu_registry: AsyncMock) -> None:
+    """Route every registry the CLI constructs to the conftest mocks."""
+
 
 class TestRegistrySearchCommand:
     def test_search_command_with_results(self) -> None:
-        mock_results = [
-            SearchResult(
-                id="1",
-                name="aws",
-                namespace="hashicorp",
-                type="provider",
-                registry_source="terraform",
-                provider_name=None,
-                latest_version="6.8.0",
-                total_versions=446,
-                description="terraform-provider-aws",
-            ),
-            SearchResult(
-                id="2",
-                name="vpc",
-                namespace="terraform-aws-modules",
-                type="module",
-                registry_source="terraform",
-                provider_name="aws",
-                latest_version="6.0.1",
-                total_versions=231,
-                description="Terraform module to create AWS VPC resources",
-            ),
-        ]
-
-        with isolated_cli_runner() as runner, patch("asyncio.run", return_value=mock_results):
+        with isolated_cli_runner() as runner, _patch_search([_AWS_PROVIDER_RESULT, _VPC_MODULE_RESULT]):
             result = runner.invoke(registry_cli.registry_cli, ["search", "aws"])
             assert result.exit_code == 0
             assert "Found 2 results for 'aws':" in result.output
-            assert "hashicorp/aws" in result.output
-            assert "terraform-aws-modules/vpc/aws" in result.output
+            # Sorted by total versions, most first
+            assert [row[2:5] for row in _table_rows(result.output)] == [
+                ["hashicorp/aws", "6.8.0", "446"],
+                ["terraform-aws-modules/vpc/aws", "6.0.1", "231"],
+            ]
 
     def test_search_command_no_results(self) -> None:
-        with isolated_cli_runner() as runner, patch("asyncio.run", return_value=[]):
+        with isolated_cli_runner() as runner, _patch_search([]):
             result = runner.invoke(registry_cli.registry_cli, ["search", "nonexistent"])
             assert result.exit_code == 0
             assert "No results found for 'nonexistent'" in result.output
-
-    def test_search_command_with_type_filter(self) -> None:
-        mock_results = [
-            SearchResult(
-                id="1",
-                name="aws",
-                namespace="hashicorp",
-                type="provider",
-                registry_source="terraform",
-                provider_name=None,
-                latest_version="6.8.0",
-                total_versions=446,
-            )
-        ]
-
-        with isolated_cli_runner() as runner:
-            with patch("asyncio.run", return_value=mock_results):
-                result = runner.invoke(registry_cli.registry_cli, ["search", "aws", "-t", "provider"])
+            assert _table_rows(result.output) == []
+
+    @pytest.mark.parametrize(
+        ("resource_type", "expected_row"),
+        [
+            ("provider", ["🏢", "🔌", "hashicorp/aws", "6.8.0", "446", "terraform-provider-aws"]),
+            (
+                "module",
+                [
+                    "🏢",
+                    "📦",
+                    "terraform-aws-modules/vpc/aws",
+                    "6.0.1",
+                    "231",
+                    "Terraform module to create AWS VPC resources",
+                ],
+            ),
+        ],
+    )
+    def test_search_command_with_type_filter(self, resource_type: str, expected_row: list[str]) -> None:
+        with isolated_cli_runner() as runner, _patch_search([_AWS_PROVIDER_RESULT, _VPC_MODULE_RESULT]):
+            result = runner.invoke(registry_cli.registry_cli, ["search", "aws", "-t", resource_type])
             assert result.exit_code == 0
-            assert "hashicorp/aws" in result.output
+            assert _table_rows(result.output) == [expected_row]
 
     def test_search_command_no_term(self) -> None:
         with isolated_cli_runner() as runner:
@@ -81,74 +105,50 @@ class TestRegistrySearchCommand:
 
 
 class TestProviderCommands:
-    @patch("tofusoup.registry.cli.IBMTerraformRegistry")
-    @patch("tofusoup.registry.cli.OpenTofuRegistry")
-    def test_provider_info_command(
-        self, mock_tofu_reg: MagicMock, mock_tf_reg: MagicMock, sample_provider: Provider
-    ) -> None:
-        # Setup mocks
-        mock_tf_instance = AsyncMock()
-        mock_tf_instance.get_provider_details = AsyncMock(
-            return_value={
-                "namespace": sample_provider.namespace,
-                "name": sample_provider.name,
-                "description": sample_provider.description,
-                "source": sample_provider.source_url,
-                "download_count": 1000000,
-            }
-        )
-        mock_tf_instance.__class__.__name__ = "IBMTerraformRegistry"
-        mock_tf_reg.return_value = mock_tf_instance
-
-        mock_tofu_instance = AsyncMock()
-        mock_tofu_instance.get_provider_details = AsyncMock(side_effect=Exception("Not found"))
-        mock_tofu_instance.__class__.__name__ = "OpenTofuRegistry"
-        mock_tofu_reg.return_value = mock_tofu_instance
-
+    @pytest.mark.parametrize(
+        ("argv", "expected", "unexpected"),
+        [
+            pytest.param(
+                ["provider", "info", "hashicorp/aws", "-r", "terraform"],
+                ["Provider: hashicorp/aws", "terraform-provider-aws"],
+                [],
+                id="info",
+            ),
+            pytest.param(
+                ["provider", "versions", "hashicorp/aws", "-r", "terraform"],
+                ["Provider: hashicorp/aws", "6.8.0", "Versions (3 total):"],
+                [],
+                id="versions",
+            ),
+            pytest.param(
+                ["provider", "versions", "hashicorp/aws", "--latest", "-r", "terraform"],
+                ["Latest version: 6.8.0"],
+                ["Versions (3 total):"],
+                id="versions-latest",
+            ),
+        ],
+    )
+    def test_provider_commands(self, argv: list[str], expected: list[str], unexpected: list[str]) -> None:
         with isolated_cli_runner() as runner:
-            result = runner.invoke(registry_cli.registry_cli, ["provider", "info", "hashicorp/aws"])
+            result = runner.invoke(registry_cli.registry_cli, argv)
         assert result.exit_code == 0
         assert "=== IBMTerraform Registry ===" in result.output
-        assert "Provider: hashicorp/aws" in result.output
-        assert "terraform-provider-aws" in result.output
-
-    @patch("tofusoup.registry.cli.IBMTerraformRegistry")
-    def test_provider_versions_command(
-        self, mock_tf_reg: MagicMock, mock_provider_details: dict, mock_provider_versions: list
-    ) -> None:
-        mock_tf_instance = AsyncMock()
-        mock_tf_instance.get_provider_details = AsyncMock(return_value=mock_provider_details)
-        mock_tf_instance.list_provider_versions = AsyncMock(return_value=mock_provider_versions)
-        mock_tf_instance.__class__.__name__ = "IBMTerraformRegistry"
-        mock_tf_reg.return_value = mock_tf_instance
+        for needle in expected:
+            assert needle in result.output
+        for needle in unexpected:
+            assert needle not in result.output
 
-        with isolated_cli_runner() as runner:
-            result = runner.invoke(
-                registry_cli.registry_cli, ["provider", "versions", "hashicorp/aws", "-r", "terraform"]
-            )
-        assert result.exit_code == 0
-        assert "Provider: hashicorp/aws" in result.output
-        assert "6.8.0" in result.output
-        assert "Versions (3 total):" in result.output
-
-    @patch("tofusoup.registry.cli.IBMTerraformRegistry")
-    def test_provider_versions_latest_flag(
-        self, mock_tf_reg: MagicMock, mock_provider_details: dict, mock_provider_versions: list
-    ) -> None:
-        mock_tf_instance = AsyncMock()
-        mock_tf_instance.get_provider_details = AsyncMock(return_value=mock_provider_details)
-        mock_tf_instance.list_provider_versions = AsyncMock(return_value=mock_provider_versions)
-        mock_tf_instance.__class__.__name__ = "IBMTerraformRegistry"
-        mock_tf_reg.return_value = mock_tf_instance
+    def test_provider_info_both_registries(self, mock_tofu_registry: AsyncMock) -> None:
+        mock_tofu_registry.get_provider_details.side_effect = Exception("Not found")
 
         with isolated_cli_runner() as runner:
             result = runner.invoke(
-                registry_cli.registry_cli,
-                ["provider", "versions", "hashicorp/aws", "--latest", "-r", "terraform"],
+                registry_cli.registry_cli, ["provider", "info", "hashicorp/aws", "-r", "both"]
             )
         assert result.exit_code == 0
-        assert "Latest version: 6.8.0" in result.output
-        assert "Versions (3 total):" not in result.output
+        assert "Provider: hashicorp/aws" in result.output
+        assert "=== OpenTofu Registry ===" in result.output
+        assert "Error: Not found" in result.output
 
     def test_provider_info_invalid_format(self) -> None:
         with isolated_cli_runner() as runner:
@@ -158,22 +158,7 @@ class TestProviderCommands:
 
 
 class TestModuleCommands:
-    @patch("tofusoup.registry.cli.IBMTerraformRegistry")
-    def test_module_info_command(self, mock_tf_reg: MagicMock, sample_module: Module) -> None:
-        mock_tf_instance = AsyncMock()
-        mock_tf_instance.get_module_details = AsyncMock(
-            return_value={
-                "namespace": sample_module.namespace,
-                "name": sample_module.name,
-                "provider": sample_module.provider_name,
-                "description": sample_module.description,
-                "source": sample_module.source_url,
-                "download_count": sample_module.downloads,
-            }
-        )
-        mock_tf_instance.__class__.__name__ = "IBMTerraformRegistry"
-        mock_tf_reg.return_value = mock_tf_instance
-
+    def test_module_info_command(self) -> None:
         with isolated_cli_runner() as runner:
             result = runner.invoke(
                 registry_cli.registry_cli,
@@ -182,16 +167,7 @@ class TestModuleCommands:
         assert result.exit_code == 0
         assert "Module: terraform-aws-modules/vpc/aws" in result.output
 
-    @patch("tofusoup.registry.cli.IBMTerraformRegistry")
-    def test_module_versions_command(
-        self, mock_tf_reg: MagicMock, mock_module_details: dict, mock_module_versions: list
-    ) -> None:
-        mock_tf_instance = AsyncMock()
-        mock_tf_instance.get_module_details = AsyncMock(return_value=mock_module_details)
-        mock_tf_instance.list_module_versions = AsyncMock(return_value=mock_module_versions)
-        mock_tf_instance.__class__.__name__ = "IBMTerraformRegistry"
-        mock_tf_reg.return_value = mock_tf_instance
-
+    def test_module_versions_command(self) -> None:
         with isolated_cli_runner() as runner:
             result = runner.invoke(
                 registry_cli.registry_cli,
@@ -209,31 +185,7 @@ class TestModuleCommands:
 
 
 class TestCompareCommand:
-    @patch("tofusoup.registry.cli.IBMTerraformRegistry")
-    @patch("tofusoup.registry.cli.OpenTofuRegistry")
-    def test_compare_provider_command(
-        self,
-        mock_tofu_reg: MagicMock,
-        mock_tf_reg: MagicMock,
-        mock_provider_details: dict,
-        mock_provider_versions: list,
-    ) -> None:
-        # Setup Terraform registry mock
-        mock_tf_instance = AsyncMock()
-        mock_tf_instance.get_provider_details = AsyncMock(return_value=mock_provider_details)
-        mock_tf_instance.list_provider_versions = AsyncMock(return_value=mock_provider_versions)
-        mock_tf_instance.__class__.__name__ = "IBMTerraformRegistry"
-        mock_tf_reg.return_value = mock_tf_instance
-
-        # Setup OpenTofu registry mock
-        mock_tofu_instance = AsyncMock()
-        mock_tofu_instance.get_provider_details = AsyncMock(return_value=mock_provider_details)
-        mock_tofu_instance.list_provider_versions = AsyncMock(
-            return_value=mock_provider_versions[:2]
-        )  # Fewer versions
-        mock_tofu_instance.__class__.__name__ = "OpenTofuRegistry"
-        mock_tofu_reg.return_value = mock_tofu_instance
-
+    def test_compare_provider_command(self) -> None:
         with isolated_cli_runner() as runner:
             result = runner.invoke(registry_cli.registry_cli, ["compare", "hashicorp/aws"])
         assert result.exit_code == 0
@@ -4,12 +4,22 @@
 #
 
 
-from tofusoup import stir
+from typing import Any
 
+import pytest
+from rich.table import Table
 
-def test_generate_status_table() -> None:
-    """Verify the Rich table is generated correctly from the status dict."""
-    stir.test_statuses = {
+from tofusoup.stir import display
+
+_SUITE_COLUMN = 3
+_STATUS_COLUMN = 0
+
+
+@pytest.fixture(scope="module")
+def status_table() -> Table:
+    """Build the Rich status table once from a fixed status dict."""
+    statuses = {
+        "test_pass": {"text": "✅ PASS", "style": "green", "active": False, "success": True, "thread_id": "1"},
         "test_fail": {"text": "❌ FAIL", "style": "bold red", "active": False, "thread_id": "2"},
         "test_active": {
             "text": "APPLYING",
@@ -19,17 +29,38 @@ def test_generate_status_table() -> None:
             "last_log": "Still working...",
         },
     }
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(display, "test_statuses", statuses)
+        return display.generate_status_table()
+
+
+@pytest.fixture(scope="module")
+def table_cells(status_table: Table) -> tuple[list[Any], list[Any]]:
+    """Materialize the suite and status column cells once for all row assertions."""
+    return list(status_table.columns[_SUITE_COLUMN].cells), list(status_table.columns[_STATUS_COLUMN].cells)
+
+
+def test_generate_status_table_row_count(status_table: Table) -> None:
+    assert len(status_table.rows) == 3
 
-    table = stir.generate_status_table()
 
-    assert len(table.rows) == 3
-    # FIX: `table.columns[...].cells` is a generator. Convert it to a list to access by index.
-    fail_row_index = 1  # The second row in the table
-    test_suite_cell = list(table.columns[1].cells)[fail_row_index]
-    status_cell = list(table.columns[2].cells)[fail_row_index]
+# Rows are sorted by test suite name
+@pytest.mark.parametrize(
+    ("idx", "suite", "status"),
+    [
+        (0, "test_active", "🔄"),
+        (1, "test_fail", "❌"),
+        (2, "test_pass", "✅"),
+    ],
+)
+def test_generate_status_table_row(
+    table_cells: tuple[list[Any], list[Any]], idx: int, suite: str, status: str
+) -> None:
+    """Verify each row of the Rich table reflects its entry in the status dict."""
+    suite_cells, status_cells = table_cells
 
-    assert "test_fail" in str(test_suite_cell)
-    assert "FAIL" in str(status_cell)
+    assert suite in str(suite_cells[idx])
+    assert status in str(status_cells[idx])
 
 
 # 🥣🔬🔚